@@ -35,6 +35,16 @@ SWAGGER_DEFAULTS = {
     "EXCLUDED_MEDIA_TYPES": ["html"],
     "DEFAULT_INFO": None,
     "DEFAULT_API_URL": None,
+    "SCHEMA_CACHE_SIZE": 0,
+    "SCHEMA_CACHE_TIMEOUT": None,
+    "SCHEMA_CACHE_MAX_STALENESS": 0,
+    "SCHEMA_CACHE_ALIAS": None,
+    "SCHEMA_CACHE_LOCK_TIMEOUT": 0,
+    "SCHEMA_EXECUTOR_WORKERS": 4,
+    "SCHEMA_GENERATION_THREADS": 0,
+    "PRIVATE_SCHEMA_CACHE": None,
+    "PRECOMPRESS_SPEC": False,
+    "WARM_UP_SCHEMA": False,
     "USE_SESSION_AUTH": True,
     "USE_COMPAT_RENDERERS": getattr(settings, "SWAGGER_USE_COMPAT_RENDERERS", True),
     "CSRF_COOKIE_NAME": settings.CSRF_COOKIE_NAME,
@@ -49,6 +59,7 @@ SWAGGER_DEFAULTS = {
     "REFETCH_SCHEMA_WITH_AUTH": False,
     "REFETCH_SCHEMA_ON_LOGOUT": False,
     "FETCH_SCHEMA_WITH_QUERY": True,
+    "LAZY_LOAD_SPEC": False,
     "OPERATIONS_SORTER": None,
     "TAGS_SORTER": None,
     "DOC_EXPANSION": "list",
@@ -81,6 +92,7 @@ REDOC_DEFAULTS = {
     "NATIVE_SCROLLBARS": False,
     "REQUIRED_PROPS_FIRST": False,
     "FETCH_SCHEMA_WITH_QUERY": True,
+    "LAZY_LOAD_SPEC": False,
     "HIDE_DOWNLOAD_BUTTON": False,
 }
 
@@ -0,0 +1,13 @@
+from django.apps import AppConfig
+
+
+class DrfYasgConfig(AppConfig):
+    name = "drf_yasg"
+
+    def ready(self):
+        from .app_settings import swagger_settings
+
+        if swagger_settings.WARM_UP_SCHEMA:
+            from .caching import warm_up_schema_cache
+
+            warm_up_schema_cache(background=True)
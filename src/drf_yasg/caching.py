@@ -0,0 +1,683 @@
+import asyncio
+import contextvars
+import functools
+import hashlib
+import json
+import logging
+import os
+import pickle
+import sys
+import threading
+import time
+import urllib.parse as urlparse
+import uuid
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+
+from django.core.cache import caches
+from django.core.cache.backends.base import DEFAULT_TIMEOUT
+from django.core.signals import setting_changed
+from django.db import close_old_connections, connections
+from django.dispatch import receiver
+from django.urls import (
+    URLPattern,
+    URLResolver,
+    get_resolver,
+    get_script_prefix,
+    get_urlconf,
+    set_script_prefix,
+    set_urlconf,
+)
+from django.utils import translation
+from rest_framework.settings import api_settings
+
+from . import openapi
+from .app_settings import swagger_settings
+from .codecs import OpenAPICodecJson, OpenAPICodecYaml, yaml_load
+from .renderers import COMPRESSORS, _SpecRenderer
+
+logger = logging.getLogger(__name__)
+
+
+def bind_request_context(func):
+    """Wrap `func` so that it runs with the active language, script prefix and URLconf
+    of the current thread, even when it is called from another thread.
+
+    Django keeps these in ``asgiref.local.Local`` storage, which other threads do not
+    inherit, not even when running in a copy of the current ``contextvars`` context.
+    The generated schema depends on all of them.
+
+    :param func: the callable to wrap
+    :rtype: callable
+    """
+    language = translation.get_language()
+    script_prefix = get_script_prefix()
+    urlconf = get_urlconf()
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        previous_script_prefix = get_script_prefix()
+        previous_urlconf = get_urlconf()
+        set_script_prefix(script_prefix)
+        set_urlconf(urlconf)
+        try:
+            with translation.override(language):
+                return func(*args, **kwargs)
+        finally:
+            set_script_prefix(previous_script_prefix)
+            set_urlconf(previous_urlconf)
+
+    return wrapper
+
+
+class SchemaCache:
+    """A thread-safe, size-bounded LRU mapping used for keeping generated
+    :class:`.Swagger` objects in memory between requests.
+
+    The cache is emptied whenever a Django setting changes or the URLconf is reloaded
+    (i.e. after ``django.urls.clear_url_caches()`` has been called).
+    """
+
+    def __init__(self, maxsize=None):
+        """
+        :param int maxsize: maximum number of entries; if ``None``, the
+            :ref:`SCHEMA_CACHE_SIZE <schema-cache-settings>` setting is used
+        """
+        self._maxsize = maxsize
+        self._entries = {}
+        self._lock = threading.RLock()
+        self._resolver = None
+        self._refreshing = set()
+        self._key_locks = {}
+
+    @property
+    def maxsize(self):
+        """Maximum number of schemas kept in the cache; 0 disables caching.
+
+        :rtype: int
+        """
+        if self._maxsize is not None:
+            return self._maxsize
+        return swagger_settings.SCHEMA_CACHE_SIZE or 0
+
+    def _check_urlconf(self):
+        # get_resolver() is memoized and cleared by clear_url_caches(), so getting back
+        # a different resolver object means that the URLconf was reloaded
+        resolver = get_resolver()
+        if resolver is not self._resolver:
+            if self._entries:
+                logger.debug("URLconf reloaded, clearing schema cache")
+            self._entries.clear()
+            self._resolver = resolver
+
+    def get(self, key, default=None):
+        """Get the value stored under `key`, marking it as the most recently used.
+
+        :param key: a hashable cache key
+        :param default: value returned if `key` is not in the cache
+        """
+        with self._lock:
+            self._check_urlconf()
+            try:
+                value = self._entries.pop(key)
+            except KeyError:
+                return default
+
+            self._entries[key] = value
+            return value
+
+    def set(self, key, value):
+        """Store `value` under `key`, evicting the least recently used entries if the
+        cache is full. Does nothing if the cache is disabled.
+
+        :param key: a hashable cache key
+        :param value: the value to store
+        """
+        maxsize = self.maxsize
+        if maxsize <= 0:
+            return
+
+        with self._lock:
+            self._check_urlconf()
+            self._entries.pop(key, None)
+            self._entries[key] = value
+            while len(self._entries) > maxsize:
+                # dicts are ordered, so the first key is the least recently used one
+                del self._entries[next(iter(self._entries))]
+
+    @contextmanager
+    def lock(self, key):
+        """Context manager holding a lock specific to `key`, used for making
+        concurrent threads that miss the same key wait for a single one of them to
+        generate the value, instead of each generating its own.
+
+        :param key: a hashable cache key
+        """
+        with self._lock:
+            key_lock = self._key_locks.get(key)
+            if key_lock is None:
+                key_lock = self._key_locks[key] = [threading.Lock(), 0]
+            key_lock[1] += 1
+
+        try:
+            with key_lock[0]:
+                yield
+        finally:
+            with self._lock:
+                key_lock[1] -= 1
+                if not key_lock[1]:
+                    del self._key_locks[key]
+
+    def refresh(self, key, generate):
+        """Regenerate the value stored under `key` in a background thread, by calling
+        `generate` and storing its result. At most one refresh runs at a time for any
+        given key; while it runs, the current value keeps being served.
+
+        `generate` runs with the active language, script prefix and URLconf of the
+        caller.
+
+        :param key: a hashable cache key
+        :param generate: callable taking no arguments that returns the new value
+        :return: the started thread, or ``None`` if a refresh of `key` was already
+            running
+        :rtype: threading.Thread or None
+        """
+        with self._lock:
+            if key in self._refreshing:
+                return None
+            self._refreshing.add(key)
+
+        generate = bind_request_context(generate)
+
+        def run():
+            try:
+                self.set(key, generate())
+            except Exception:
+                logger.warning("background schema regeneration failed", exc_info=True)
+            finally:
+                with self._lock:
+                    self._refreshing.discard(key)
+                connections.close_all()
+
+        thread = threading.Thread(target=run, name="drf-yasg-refresh", daemon=True)
+        thread.start()
+        return thread
+
+    def clear(self):
+        """Remove all entries from the cache."""
+        with self._lock:
+            self._entries.clear()
+
+    def __contains__(self, key):
+        with self._lock:
+            return key in self._entries
+
+    def __len__(self):
+        with self._lock:
+            return len(self._entries)
+
+
+#: process-wide cache used by :class:`.SchemaView`
+schema_cache = SchemaCache()
+
+#: process-wide cache of the endpoints enumerated from the URLconf by
+#: :class:`~.generators.EndpointEnumerator`
+endpoint_cache = SchemaCache(maxsize=32)
+
+
+def _stable_repr(value):
+    # repr() that does not depend on object identity, so that it is the same in all
+    # processes running the same code
+    if isinstance(value, type):
+        return "%s.%s" % (value.__module__, value.__qualname__)
+    if isinstance(value, (tuple, list)):
+        return "(%s)" % ", ".join(_stable_repr(item) for item in value)
+    if isinstance(value, (URLPattern, URLResolver)):
+        return "%s(%r)" % (type(value).__name__, str(value.pattern))
+    if isinstance(value, dict):
+        return json.dumps(value, sort_keys=True, default=str)
+    return repr(value)
+
+
+class SharedSchemaCache:
+    """Keeps generated :class:`.Swagger` objects in a Django cache, so that a schema
+    generated by one process can be reused by all the others.
+
+    Schemas are pickled and zlib-compressed, then split into chunks no larger than
+    :attr:`.chunk_size`, which keeps them under the item size limit of memcached.
+    """
+
+    #: maximum size in bytes of a single cache item
+    chunk_size = 1000 * 1000
+
+    def __init__(self, alias=None, chunk_size=None):
+        """
+        :param str alias: alias of the Django cache to use; if ``None``, the
+            :ref:`SCHEMA_CACHE_ALIAS <schema-cache-settings>` setting is used
+        :param int chunk_size: overrides :attr:`.chunk_size`
+        """
+        self._alias = alias
+        if chunk_size is not None:
+            self.chunk_size = chunk_size
+
+    @property
+    def enabled(self):
+        """Whether a cache alias is configured.
+
+        :rtype: bool
+        """
+        return bool(self._alias or swagger_settings.SCHEMA_CACHE_ALIAS)
+
+    @property
+    def cache(self):
+        return caches[self._alias or swagger_settings.SCHEMA_CACHE_ALIAS]
+
+    def make_key(self, *parts):
+        """Build a cache key out of `parts`, which can be anything that could also make
+        up a :data:`.schema_cache` key, and is the same in all processes.
+
+        :rtype: str
+        """
+        key_repr = _stable_repr(parts).encode("utf-8")
+        return "drf_yasg:schema:" + hashlib.sha256(key_repr).hexdigest()
+
+    def get(self, key):
+        """Get the schema stored under `key`.
+
+        :param str key: key returned by :meth:`.make_key`
+        :return: the schema, or ``None`` if it is not (completely) in the cache
+        :rtype: openapi.Swagger or None
+        """
+        cache = self.cache
+        header = cache.get(key)
+        if header is None:
+            return None
+
+        digest, chunk_count = header
+        chunk_keys = ["%s:%s:%d" % (key, digest, i) for i in range(chunk_count)]
+        chunks = cache.get_many(chunk_keys)
+        if len(chunks) != chunk_count:
+            return None
+
+        try:
+            return pickle.loads(
+                zlib.decompress(b"".join(chunks[k] for k in chunk_keys))
+            )
+        except Exception:
+            logger.warning("could not load schema from shared cache", exc_info=True)
+            return None
+
+    @contextmanager
+    def lock(self, key, timeout):
+        """Context manager trying to take a lock on `key` that is shared by all the
+        processes using the cache, relying on the atomicity of ``cache.add()``.
+
+        It does not block; its value tells whether the lock was acquired. If it was
+        not, another process is generating the schema and :meth:`.wait` can be used
+        to wait for its result.
+
+        :param str key: key returned by :meth:`.make_key`
+        :param int timeout: number of seconds after which the lock expires, in case its
+            holder never releases it
+        """
+        lock_key = key + ":lock"
+        token = uuid.uuid4().hex
+        acquired = self.cache.add(lock_key, token, timeout)
+        try:
+            yield acquired
+        finally:
+            if acquired and self.cache.get(lock_key) == token:
+                self.cache.delete(lock_key)
+
+    def wait(self, key, timeout, interval=0.1):
+        """Poll the cache until a schema is stored under `key`.
+
+        :param str key: key returned by :meth:`.make_key`
+        :param float timeout: maximum number of seconds to wait
+        :param float interval: number of seconds between polls
+        :return: the schema, or ``None`` if it did not show up in time
+        :rtype: openapi.Swagger or None
+        """
+        deadline = time.monotonic() + timeout
+        while True:
+            schema = self.get(key)
+            if schema is not None or time.monotonic() >= deadline:
+                return schema
+            time.sleep(interval)
+
+    def set(self, key, schema, timeout=DEFAULT_TIMEOUT):
+        """Store `schema` under `key`.
+
+        :param str key: key returned by :meth:`.make_key`
+        :param openapi.Swagger schema: the schema to store
+        :param timeout: cache timeout in seconds; if not given, the schema is kept for
+            :ref:`SCHEMA_CACHE_TIMEOUT <schema-cache-settings>` plus
+            :ref:`SCHEMA_CACHE_MAX_STALENESS <schema-cache-settings>` seconds, or for
+            the cache's default timeout if that setting is ``None``
+        """
+        if timeout is DEFAULT_TIMEOUT and swagger_settings.SCHEMA_CACHE_TIMEOUT:
+            timeout = swagger_settings.SCHEMA_CACHE_TIMEOUT + (
+                swagger_settings.SCHEMA_CACHE_MAX_STALENESS or 0
+            )
+
+        data = zlib.compress(pickle.dumps(schema, pickle.HIGHEST_PROTOCOL))
+        # chunk keys are derived from the content, so that readers never mix up
+        # chunks of two schemas stored concurrently under the same key
+        digest = hashlib.sha256(data).hexdigest()[:16]
+        chunks = {
+            "%s:%s:%d" % (key, digest, i): data[offset : offset + self.chunk_size]
+            for i, offset in enumerate(range(0, len(data), self.chunk_size))
+        }
+
+        cache = self.cache
+        cache.set_many(chunks, timeout)
+        cache.set(key, (digest, len(chunks)), timeout)
+
+
+#: cache shared between processes used by :class:`.SchemaView`, if
+#: :ref:`SCHEMA_CACHE_ALIAS <schema-cache-settings>` is set
+shared_schema_cache = SharedSchemaCache()
+
+
+@receiver(setting_changed)
+def clear_schema_cache(**kwargs):
+    """Empty :data:`.schema_cache` and :data:`.endpoint_cache` when a setting is
+    changed, since most settings affect the generated schema."""
+    schema_cache.clear()
+    endpoint_cache.clear()
+
+
+_executor = None
+_executor_pid = None
+_executor_lock = threading.Lock()
+
+
+def get_schema_executor():
+    """Return the thread pool used for running schema generation outside of the event
+    loop. Its size is given by the
+    :ref:`SCHEMA_EXECUTOR_WORKERS <schema-cache-settings>` setting.
+
+    The pool is created on first use in each process, so that it is not inherited by
+    forked worker processes in a broken state.
+
+    :rtype: concurrent.futures.ThreadPoolExecutor
+    """
+    global _executor, _executor_pid
+    with _executor_lock:
+        if _executor is None or _executor_pid != os.getpid():
+            _executor = ThreadPoolExecutor(
+                max_workers=swagger_settings.SCHEMA_EXECUTOR_WORKERS or None,
+                thread_name_prefix="drf-yasg",
+            )
+            _executor_pid = os.getpid()
+        return _executor
+
+
+def _call_with_connections(func, *args, **kwargs):
+    # pool threads are not request threads, so Django's request_started and
+    # request_finished signals never clean up their database connections
+    close_old_connections()
+    try:
+        return func(*args, **kwargs)
+    finally:
+        close_old_connections()
+
+
+async def run_in_schema_executor(func, *args, **kwargs):
+    """Call `func` in the :func:`.get_schema_executor` thread pool and await its
+    result. The current ``contextvars`` context is propagated to the worker thread,
+    along with the active language, script prefix and URLconf (see
+    :func:`.bind_request_context`).
+
+    If the awaiting task is cancelled, e.g. because the client disconnected, the call
+    is dropped if it has not started yet; otherwise it runs to completion in the
+    background, so that its results still end up in the schema caches.
+    """
+    loop = asyncio.get_running_loop()
+    context = contextvars.copy_context()
+    call = functools.partial(
+        context.run,
+        _call_with_connections,
+        bind_request_context(func),
+        *args,
+        **kwargs,
+    )
+    return await loop.run_in_executor(get_schema_executor(), call)
+
+
+_static_specs = {}
+_static_specs_lock = threading.Lock()
+
+
+def load_static_spec(path):
+    """Load a prebuilt spec file, such as the output of the ``generate_swagger``
+    management command, into a :class:`.Swagger` object.
+
+    The file is read once and kept in memory until its modification time changes. The
+    returned object carries the file's contents, which the spec renderer of the same
+    format serves as-is instead of encoding the object again; its ``Last-Modified``
+    time is that of the file.
+
+    :param str path: path to a ``.json``, ``.yaml`` or ``.yml`` file
+    :rtype: openapi.Swagger
+    """
+    mtime = os.stat(path).st_mtime
+    with _static_specs_lock:
+        cached = _static_specs.get(path)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+
+        with open(path, "rb") as spec_file:
+            content = spec_file.read()
+        if path.endswith((".yaml", ".yml")):
+            spec, codec_class = yaml_load(content), OpenAPICodecYaml
+        else:
+            spec, codec_class = json.loads(content), OpenAPICodecJson
+
+        swagger = openapi._bare_SwaggerDict(openapi.Swagger)
+        swagger.update(spec)
+        # the UI renderers read the title and version through attribute access
+        info = openapi._bare_SwaggerDict(openapi.Info)
+        info.update(spec.get("info", {}))
+        swagger["info"] = info
+        swagger._NP_static_content = {codec_class: content}
+        swagger._last_modified = int(mtime)
+
+        _static_specs[path] = (mtime, swagger)
+        return swagger
+
+
+_module_fingerprints = {}
+
+
+def get_module_fingerprint(module_name):
+    """Get a hash of the source file of a module, or of its name if the source is not
+    available. Hashes are computed once per process.
+
+    :param str module_name: name of an imported module
+    :rtype: str
+    """
+    fingerprint = _module_fingerprints.get(module_name)
+    if fingerprint is None:
+        module = sys.modules.get(module_name)
+        source_file = getattr(module, "__file__", None)
+        digest = hashlib.sha256(module_name.encode("utf-8"))
+        if source_file:
+            try:
+                with open(source_file, "rb") as source:
+                    digest.update(source.read())
+            except OSError:  # pragma: no cover
+                pass
+        fingerprint = _module_fingerprints[module_name] = digest.hexdigest()
+    return fingerprint
+
+
+class OperationCache:
+    """Keeps generated :class:`.Operation` objects in a directory on disk, along with
+    the definitions they reference, so that they can be reused by later runs of the
+    ``generate_swagger`` command. Entries are keyed by
+    :meth:`~.OpenAPISchemaGenerator.get_operation_fingerprint` and are never expired;
+    the directory can be deleted at any time.
+    """
+
+    def __init__(self, directory):
+        """
+        :param str directory: the cache directory, created if it does not exist
+        """
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+
+    def get_path(self, key):
+        return os.path.join(self.directory, key + ".pickle")
+
+    def get(self, key):
+        """Get the entry stored under `key`.
+
+        :param str key: the operation fingerprint
+        :return: the operation and its definitions, or ``None`` if not cached
+        :rtype: tuple[openapi.Operation,dict[str,openapi.Schema]] or None
+        """
+        try:
+            with open(self.get_path(key), "rb") as entry:
+                return pickle.load(entry)
+        except FileNotFoundError:
+            return None
+        except Exception:
+            logger.warning("ignoring unreadable operation cache entry", exc_info=True)
+            return None
+
+    def set(self, key, operation, definitions):
+        """Store an operation and the definitions it references under `key`.
+
+        :param str key: the operation fingerprint
+        :param openapi.Operation operation: the generated operation
+        :param dict[str,openapi.Schema] definitions: the referenced definitions
+        """
+        path = self.get_path(key)
+        temp_path = "%s.%s.tmp" % (path, uuid.uuid4().hex)
+        with open(temp_path, "wb") as entry:
+            pickle.dump((operation, definitions), entry, pickle.HIGHEST_PROTOCOL)
+        # concurrent writers of the same entry write the same contents
+        os.replace(temp_path, path)
+
+
+def _find_schema_views(patterns, seen=None):
+    """Yield the distinct schema view classes routed by `patterns`, along with the
+    initkwargs of their first view callback."""
+    seen = set() if seen is None else seen
+    for pattern in patterns:
+        if isinstance(pattern, URLResolver):
+            yield from _find_schema_views(pattern.url_patterns, seen)
+            continue
+        if not isinstance(pattern, URLPattern):  # pragma: no cover
+            continue
+
+        view_cls = getattr(pattern.callback, "cls", None)
+        initkwargs = getattr(pattern.callback, "initkwargs", None) or {}
+        if view_cls is None or view_cls in seen:
+            continue
+        if not hasattr(view_cls, "generator_class"):
+            continue
+        renderer_classes = initkwargs.get("renderer_classes", view_cls.renderer_classes)
+        if not any(issubclass(r, _SpecRenderer) for r in renderer_classes):
+            continue
+
+        seen.add(view_cls)
+        yield view_cls, initkwargs
+
+
+def warm_up_schema_cache(
+    urlconf=None,
+    versions=None,
+    formats=("json", "yaml"),
+    base_url=None,
+    background=False,
+):
+    """Generate and encode the schemas served by all the schema views found in
+    `urlconf`, filling :data:`.schema_cache` and the encoded spec caches before any
+    request comes in.
+
+    This is meant to be called when a worker process starts, e.g. from gunicorn's
+    ``post_fork`` hook, or automatically on startup by enabling the
+    :ref:`WARM_UP_SCHEMA <schema-cache-settings>` setting. It has no effect unless
+    :ref:`SCHEMA_CACHE_SIZE <schema-cache-settings>` is set.
+
+    :param str urlconf: URLconf to search for schema views; defaults to
+        ``ROOT_URLCONF``
+    :param list[str] versions: API versions to generate; defaults to
+        ``ALLOWED_VERSIONS`` from the rest framework settings, or the unversioned
+        schema if that is not set
+    :param list[str] formats: spec renderer formats to encode
+    :param str base_url: scheme and host of the simulated requests; defaults to
+        :ref:`DEFAULT_API_URL <default-swagger-settings>`; this must match the host
+        that real requests are made against unless the schema views have a fixed
+        ``url``
+    :param bool background: if True, run in a daemon thread and return immediately
+    :return: the started thread if `background` is True, ``None`` otherwise
+    :rtype: threading.Thread or None
+    """
+    if background:
+        thread = threading.Thread(
+            target=_warm_up_in_thread,
+            args=(urlconf, versions, formats, base_url),
+            name="drf-yasg-warm-up",
+            daemon=True,
+        )
+        thread.start()
+        return thread
+
+    if schema_cache.maxsize <= 0:
+        logger.warning("schema cache is disabled, skipping warm-up")
+        return None
+
+    from rest_framework.test import APIRequestFactory
+
+    versions = versions or api_settings.ALLOWED_VERSIONS or [None]
+    base_url = base_url or swagger_settings.DEFAULT_API_URL
+    request_kwargs = {}
+    if base_url:
+        parsed_url = urlparse.urlparse(base_url)
+        request_kwargs = {
+            "HTTP_HOST": parsed_url.netloc,
+            "secure": parsed_url.scheme == "https",
+        }
+
+    content_encodings = [None]
+    if swagger_settings.PRECOMPRESS_SPEC:
+        content_encodings += list(COMPRESSORS)
+
+    factory = APIRequestFactory()
+    for view_cls, initkwargs in _find_schema_views(get_resolver(urlconf).url_patterns):
+        view = view_cls.as_view(**initkwargs)
+        for version in versions:
+            for format in formats:
+                for content_encoding in content_encodings:
+                    request = factory.get(
+                        "/",
+                        HTTP_ACCEPT_ENCODING=content_encoding or "identity",
+                        **request_kwargs,
+                    )
+                    kwargs = {"format": format}
+                    if version:
+                        kwargs["version"] = version
+                    try:
+                        view(request, **kwargs).render()
+                    except Exception:
+                        logger.warning(
+                            "failed to warm up schema of %s (version %s, format %s)",
+                            view_cls,
+                            version,
+                            format,
+                            exc_info=True,
+                        )
+
+    return None
+
+
+def _warm_up_in_thread(*args):
+    try:
+        warm_up_schema_cache(*args)
+    finally:
+        # connections are thread-local; don't leave this thread's open
+        connections.close_all()
@@ -1,12 +1,18 @@
 import copy
+import hashlib
 import logging
+import multiprocessing
 import re
 import urllib.parse as urlparse
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 
 import uritemplate
+from django.conf import settings
+from django.db import connections
 from django.urls import URLPattern, URLResolver
-from rest_framework import versioning
+from django.utils import translation
+from rest_framework import serializers, versioning
 from rest_framework.schemas.generators import EndpointEnumerator as _EndpointEnumerator
 from rest_framework.schemas.generators import endpoint_ordering, get_pk_name
 from rest_framework.schemas.openapi import SchemaGenerator
@@ -15,6 +21,13 @@ from rest_framework.settings import api_settings
 
 from . import openapi
 from .app_settings import swagger_settings
+from .caching import (
+    _stable_repr,
+    bind_request_context,
+    endpoint_cache,
+    get_module_fingerprint,
+    run_in_schema_executor,
+)
 from .errors import SwaggerGenerationError
 from .inspectors.field import (
     get_basic_type_info,
@@ -41,6 +54,116 @@ def common_path(paths):
     return "/" + "/".join(common)
 
 
+def _has_ref_name(serializer):
+    serializer_meta = getattr(serializer, "Meta", None)
+    return hasattr(serializer_meta, "ref_name")
+
+
+def _get_definition_serializer(definition):
+    # the serializer class a definition was generated from, and whether it sets an
+    # explicit ref_name; the class is not pickled, so definitions generated in another
+    # process carry its qualified name instead
+    serializer = getattr(definition, "_NP_serializer", None)
+    if serializer is not None:
+        return serializer, _has_ref_name(serializer)
+    return getattr(definition, "_serializer_name", None)
+
+
+def _split_chunks(items, count):
+    chunk_size = -(-len(items) // count)
+    return [
+        items[start : start + chunk_size] for start in range(0, len(items), chunk_size)
+    ]
+
+
+def _add_class(classes, cls):
+    if isinstance(cls, type):
+        classes.update(cls.__mro__)
+
+
+def _add_serializer(classes, obj, seen=None):
+    # add the classes of the serializers found in obj, recursing into the fields
+    # declared on them and into dicts and lists
+    seen = set() if seen is None else seen
+    if isinstance(obj, dict):
+        for value in obj.values():
+            _add_serializer(classes, value, seen)
+    elif isinstance(obj, (list, tuple)):
+        for value in obj:
+            _add_serializer(classes, value, seen)
+    elif isinstance(obj, serializers.Field):
+        _add_class(classes, type(obj))
+        _add_serializer(classes, getattr(obj, "child", None), seen)
+        if isinstance(obj, serializers.BaseSerializer):
+            _add_serializer(classes, type(obj), seen)
+    elif isinstance(obj, type) and issubclass(obj, serializers.BaseSerializer):
+        if obj in seen:
+            return
+        seen.add(obj)
+        _add_class(classes, obj)
+        _add_class(classes, getattr(getattr(obj, "Meta", None), "model", None))
+        for field in getattr(obj, "_declared_fields", {}).values():
+            _add_serializer(classes, field, seen)
+
+
+def _get_used_definitions(operation, definitions):
+    # the definitions referenced by operation, with those referenced by each
+    # definition placed before it, like they are added while generating the operation
+    prefix = "#/" + openapi.SCHEMA_DEFINITIONS + "/"
+    used = {}
+    visiting = set()
+
+    def visit(obj):
+        if isinstance(obj, dict):
+            ref = obj.get("$ref")
+            if isinstance(ref, str) and ref.startswith(prefix):
+                name = ref[len(prefix) :]
+                if name not in visiting and definitions.has(name):
+                    visiting.add(name)
+                    definition = definitions.get(name)
+                    visit(definition)
+                    used[name] = definition
+            for value in obj.values():
+                visit(value)
+        elif isinstance(obj, (list, tuple)):
+            for value in obj:
+                visit(value)
+
+    visit(operation)
+    return used
+
+
+_fork_state = None
+
+
+def _generate_forked_chunk(index):
+    # runs in a process forked by get_path_items_forked; the connections inherited
+    # from the parent process are still in use there, so they are dropped without
+    # being closed
+    for connection in connections.all():
+        connection.connection = None
+
+    generator, chunks, prefix, scopes, request, public = _fork_state
+    try:
+        paths, components = generator.get_path_chunk(
+            chunks[index], prefix, scopes, request, public
+        )
+    finally:
+        connections.close_all()
+
+    for scope in components.scopes:
+        objects = components.with_scope(scope)
+        for name in objects:
+            obj = objects.get(name)
+            serializer = getattr(obj, "_NP_serializer", None)
+            if serializer is not None:
+                obj._serializer_name = (
+                    "%s.%s" % (serializer.__module__, serializer.__qualname__),
+                    _has_ref_name(serializer),
+                )
+    return paths, components
+
+
 def is_custom_action(action):
     return action not in {
         "retrieve",
@@ -123,8 +246,19 @@ class EndpointEnumerator(_EndpointEnumerator):
         """
         Return a list of all available API endpoints by inspecting the URL conf.
 
-        Copied entirely from super.
+        Copied entirely from super, except that the result of enumerating the whole
+        URLconf is kept in :data:`~.caching.endpoint_cache` under
+        :meth:`.get_snapshot_key`.
         """
+        if patterns is None and not prefix and ignored_endpoints is None:
+            key = self.get_snapshot_key()
+            if key is not None:
+                snapshot = endpoint_cache.get(key)
+                if snapshot is None:
+                    snapshot = tuple(self.get_api_endpoints(self.patterns))
+                    endpoint_cache.set(key, snapshot)
+                return list(snapshot)
+
         if patterns is None:
             patterns = self.patterns
 
@@ -176,6 +310,25 @@ class EndpointEnumerator(_EndpointEnumerator):
 
         return api_endpoints
 
+    def get_snapshot_key(self):
+        """Return the key under which the endpoints enumerated from the whole URLconf
+        are cached, or ``None`` to enumerate them again on every call.
+
+        The enumeration only depends on the URL patterns and on ``request.version``
+        (see :meth:`.should_include_endpoint` and :meth:`.replace_version`); subclasses
+        whose enumeration depends on anything else must include it in the key or return
+        ``None``.
+
+        :rtype: tuple or None
+        """
+        try:
+            patterns = tuple(self.patterns)
+            key = (type(self), patterns, getattr(self.request, "version", None))
+            hash(key)
+        except TypeError:
+            return None
+        return key
+
     def unescape(self, s):
         """Unescape all backslash escapes from `s`.
 
@@ -211,6 +364,137 @@ class EndpointEnumerator(_EndpointEnumerator):
         return clean_path
 
 
+class EndpointFilter:
+    """Selects the endpoints included in a generated schema by path prefix, tag or
+    operation id. An endpoint is included if it matches any of the given include values
+    of each kind, and none of the exclude values.
+
+    Path prefixes are matched against whole path components of the endpoint path, as
+    enumerated from the urlconf (i.e. without the script prefix), and are applied
+    before any view is instantiated; tags and operation ids are matched against the
+    values returned by the view inspector, before the operation is generated.
+    """
+
+    #: query parameters read by :meth:`.from_query_params`, mapped to the
+    #: :meth:`__init__` argument they set
+    query_params = {
+        "tags": "tags",
+        "exclude_tags": "exclude_tags",
+        "path_prefix": "path_prefixes",
+        "exclude_path_prefix": "exclude_path_prefixes",
+        "operation_id": "operation_ids",
+        "exclude_operation_id": "exclude_operation_ids",
+    }
+
+    def __init__(
+        self,
+        tags=None,
+        exclude_tags=None,
+        path_prefixes=None,
+        exclude_path_prefixes=None,
+        operation_ids=None,
+        exclude_operation_ids=None,
+    ):
+        """
+        :param list[str] tags: include only operations with any of these tags
+        :param list[str] exclude_tags: exclude operations with any of these tags
+        :param list[str] path_prefixes: include only endpoints under one of these paths
+        :param list[str] exclude_path_prefixes: exclude endpoints under these paths
+        :param list[str] operation_ids: include only these operations
+        :param list[str] exclude_operation_ids: exclude these operations
+        """
+        self.tags = frozenset(tags or ())
+        self.exclude_tags = frozenset(exclude_tags or ())
+        self.path_prefixes = frozenset(
+            "/" + prefix.strip("/") for prefix in path_prefixes or ()
+        )
+        self.exclude_path_prefixes = frozenset(
+            "/" + prefix.strip("/") for prefix in exclude_path_prefixes or ()
+        )
+        self.operation_ids = frozenset(operation_ids or ())
+        self.exclude_operation_ids = frozenset(exclude_operation_ids or ())
+
+    @classmethod
+    def from_query_params(cls, query_params):
+        """Build a filter from the query parameters named in :attr:`.query_params`.
+        Each of them can be repeated, or given a comma-separated list of values.
+
+        :param django.http.QueryDict query_params: the request query parameters
+        :return: the filter, or ``None`` if no filtering parameter is present
+        :rtype: EndpointFilter or None
+        """
+        kwargs = {}
+        for param, arg in cls.query_params.items():
+            values = [
+                value.strip()
+                for values in query_params.getlist(param)
+                for value in values.split(",")
+                if value.strip()
+            ]
+            if values:
+                kwargs[arg] = values
+        if not kwargs:
+            return None
+        return cls(**kwargs)
+
+    def _key(self):
+        return tuple(
+            tuple(sorted(getattr(self, arg))) for arg in self.query_params.values()
+        )
+
+    def __eq__(self, other):
+        return type(self) is type(other) and self._key() == other._key()
+
+    def __hash__(self):
+        return hash(self._key())
+
+    def __repr__(self):
+        return "%s%r" % (type(self).__name__, self._key())
+
+    @staticmethod
+    def _is_under(path, prefixes):
+        return any(
+            path == prefix or path.startswith(prefix + "/") for prefix in prefixes
+        )
+
+    def include_path(self, path):
+        """Check if endpoints at `path` can be included.
+
+        :param str path: the templated endpoint path
+        :rtype: bool
+        """
+        path = "/" + path.strip("/")
+        if self.path_prefixes and not self._is_under(path, self.path_prefixes):
+            return False
+        return not self._is_under(path, self.exclude_path_prefixes)
+
+    def include_operation(self, tags, operation_id):
+        """Check if an operation with the given tags and id should be included.
+
+        :param list[str] tags: the tags of the operation
+        :param str operation_id: the id of the operation
+        :rtype: bool
+        """
+        tags = set(tags or ())
+        if self.tags and not self.tags & tags:
+            return False
+        if self.exclude_tags & tags:
+            return False
+        if self.operation_ids and operation_id not in self.operation_ids:
+            return False
+        return operation_id not in self.exclude_operation_ids
+
+    @property
+    def filters_operations(self):
+        """Whether :meth:`.include_operation` can exclude any operation."""
+        return bool(
+            self.tags
+            or self.exclude_tags
+            or self.operation_ids
+            or self.exclude_operation_ids
+        )
+
+
 class OpenAPISchemaGenerator:
     """
     This class iterates over all registered API endpoints and returns an appropriate
@@ -220,6 +504,15 @@ class OpenAPISchemaGenerator:
 
     endpoint_enumerator_class = EndpointEnumerator
     reference_resolver_class = ReferenceResolver
+    #: if set, only the endpoints selected by this :class:`.EndpointFilter` are
+    #: included in the schema
+    endpoint_filter = None
+    #: if greater than ``1``, operations are generated in this many forked processes;
+    #: see :meth:`.get_path_items_forked`
+    generation_processes = 0
+    #: if set, an :class:`~.caching.OperationCache` in which generated operations are
+    #: kept between runs, keyed by :meth:`.get_operation_fingerprint`
+    operation_cache = None
 
     # Map HTTP methods onto actions.
     default_mapping = {
@@ -230,7 +523,15 @@ class OpenAPISchemaGenerator:
         "delete": "destroy",
     }
 
-    def __init__(self, info, version="", url=None, patterns=None, urlconf=None):
+    def __init__(
+        self,
+        info,
+        version="",
+        url=None,
+        patterns=None,
+        urlconf=None,
+        endpoint_filter=None,
+    ):
         """
 
         :param openapi.Info info: information about the API
@@ -252,6 +553,8 @@ class OpenAPISchemaGenerator:
             in the API spec
         :param urlconf: if patterns is not given, use this urlconf to enumerate
             patterns; if not given, the default urlconf is used
+        :param EndpointFilter endpoint_filter: if given, only the endpoints it selects
+            are included in the spec
         """
         self._gen = SchemaGenerator(
             info.title, url, info.get("description", ""), patterns, urlconf
@@ -261,6 +564,8 @@ class OpenAPISchemaGenerator:
         self.consumes = []
         self.produces = []
         self.coerce_method_names = api_settings.SCHEMA_COERCE_METHOD_NAMES
+        if endpoint_filter is not None:
+            self.endpoint_filter = endpoint_filter
 
         if url is None and swagger_settings.DEFAULT_API_URL is not None:
             url = swagger_settings.DEFAULT_API_URL
@@ -316,6 +621,17 @@ class OpenAPISchemaGenerator:
         security_requirements = sorted(security_requirements, key=list)
         return security_requirements
 
+    async def aget_schema(self, request=None, public=False):
+        """Asynchronous version of :meth:`.get_schema`, which runs it in the
+        :func:`~.caching.get_schema_executor` thread pool so that the event loop is not
+        blocked while the schema is generated.
+
+        :param request: same as :meth:`.get_schema`
+        :param bool public: same as :meth:`.get_schema`
+        :rtype: openapi.Swagger
+        """
+        return await run_in_schema_executor(self.get_schema, request, public)
+
     def get_schema(self, request=None, public=False):
         """Generate a :class:`.Swagger` object representing the API schema.
 
@@ -402,7 +718,8 @@ class OpenAPISchemaGenerator:
 
     def get_endpoints(self, request):
         """Iterate over all the registered endpoints in the API and return a fake view
-        with the right parameters.
+        with the right parameters. Paths rejected by :attr:`.endpoint_filter` are
+        skipped before their views are created.
 
         :param request: request to bind to the endpoint views
         :type request: rest_framework.request.Request or None
@@ -416,7 +733,10 @@ class OpenAPISchemaGenerator:
 
         view_paths = defaultdict(list)
         view_cls = {}
+        endpoint_filter = self.endpoint_filter
         for path, method, callback in endpoints:
+            if endpoint_filter is not None and not endpoint_filter.include_path(path):
+                continue
             view = self.create_view(callback, method, request)
             path = self.coerce_path(path, view)
             view_paths[path].append((method, view))
@@ -523,6 +843,133 @@ class OpenAPISchemaGenerator:
         """
         return public or self._gen.has_view_permissions(path, method, view)
 
+    def get_permission_fingerprint(self, request=None, public=False):
+        """Compute a fingerprint of the set of endpoints that are visible through
+        `request`. This only runs the permission checks done by
+        :meth:`.should_include_endpoint`, without generating any operations.
+
+        Two requests with equal fingerprints see the same endpoints, and can thus share
+        the same generated schema, as long as operations do not otherwise depend on the
+        requesting user.
+
+        :param request: the request used for filtering accessible endpoints
+        :type request: rest_framework.request.Request or None
+        :param bool public: if True, all endpoints are included regardless of access
+            through `request`
+        :return: hex digest of the visible ``(path, method)`` pairs
+        :rtype: str
+        """
+        visible = self.get_visible_endpoints(request, public)
+        return hashlib.sha256(repr(visible).encode("utf-8")).hexdigest()
+
+    def get_visible_endpoints(self, request=None, public=False):
+        """Get the ``(path, method)`` pairs of all endpoints that are visible through
+        `request`, as decided by :meth:`.should_include_endpoint`.
+
+        :param request: the request used for filtering accessible endpoints
+        :type request: rest_framework.request.Request or None
+        :param bool public: if True, all endpoints are included regardless of access
+            through `request`
+        :return: sorted list of ``(path, method)`` pairs
+        :rtype: list[tuple[str,str]]
+        """
+        endpoints = self.get_endpoints(request)
+        return sorted(
+            (path, method)
+            for path, (view_cls, methods) in endpoints.items()
+            for method, view in methods
+            if self.should_include_endpoint(path, method, view, public)
+        )
+
+    def prune_schema(self, schema, request=None, public=False):
+        """Derive the schema visible through `request` from a schema that was generated
+        with ``public=True``. Operations that fail the permission checks of
+        :meth:`.should_include_endpoint` are dropped, along with any definitions that
+        are no longer referenced by the remaining operations.
+
+        The returned schema is a shallow copy; operations and definitions are shared
+        with `schema` and must not be modified.
+
+        :param openapi.Swagger schema: the complete, public schema
+        :param request: the request used for filtering accessible endpoints
+        :type request: rest_framework.request.Request or None
+        :param bool public: if True, all endpoints are included regardless of access
+            through `request`
+        :return: the pruned schema
+        :rtype: openapi.Swagger
+        """
+        endpoints = self.get_endpoints(request)
+        prefix = self.determine_path_prefix(list(endpoints.keys())) or ""
+
+        visible = defaultdict(set)
+        for path, method in self.get_visible_endpoints(request, public):
+            path_suffix = path[len(prefix) :]
+            if not path_suffix.startswith("/"):
+                path_suffix = "/" + path_suffix
+            visible[path_suffix].add(method.lower())
+
+        paths = {}
+        for path_suffix, path_item in schema.paths.items():
+            methods = visible.get(path_suffix)
+            if not methods:
+                continue
+            path_item = copy.copy(path_item)
+            for method in openapi.PathItem.OPERATION_NAMES:
+                if method not in methods:
+                    path_item.pop(method, None)
+            if path_item.operations:
+                paths[path_suffix] = path_item
+
+        pruned = copy.copy(schema)
+        pruned.paths = self.get_paths_object(paths)
+        definitions = pruned.pop("definitions", None)
+        if definitions is not None:
+            referenced = openapi.get_referenced_definitions(paths, definitions)
+            pruned.definitions = {
+                name: model for name, model in definitions.items() if name in referenced
+            }
+        return pruned
+
+    def get_schema_index(self, schema):
+        """Derive a lightweight index of `schema`, used by the web UIs to render the
+        list of operations before loading the full spec. Operations only keep their id,
+        summary, tags, deprecation flag and response descriptions, and no definitions
+        are included.
+
+        The returned schema is a shallow copy; objects kept from `schema` are shared
+        with it and must not be modified.
+
+        :param openapi.Swagger schema: the full schema
+        :return: the index
+        :rtype: openapi.Swagger
+        """
+        paths = {}
+        for path, path_item in schema.paths.items():
+            operations = {}
+            for method in openapi.PathItem.OPERATION_NAMES:
+                operation = path_item.get(method)
+                if operation is None:
+                    continue
+                responses = {
+                    status: openapi.Response(response.get("description", ""))
+                    for status, response in operation.get("responses", {}).items()
+                }
+                operations[method] = openapi.Operation(
+                    operation_id=operation.get("operationId"),
+                    responses=openapi.Responses(responses),
+                    summary=operation.get("summary"),
+                    tags=operation.get("tags"),
+                    deprecated=operation.get("deprecated"),
+                )
+            paths[path] = openapi.PathItem(
+                parameters=path_item.get("parameters"), **operations
+            )
+
+        index = copy.copy(schema)
+        index.paths = self.get_paths_object(paths)
+        index.pop("definitions", None)
+        return index
+
     def get_paths_object(self, paths):
         """Construct the Swagger Paths object.
 
@@ -536,6 +983,10 @@ class OpenAPISchemaGenerator:
     def get_paths(self, endpoints, components, request, public):
         """Generate the Swagger Paths for the API from the given endpoints.
 
+        If :ref:`SCHEMA_GENERATION_THREADS <default-swagger-settings>` is greater than
+        ``1``, operations are generated in parallel by :meth:`.get_path_items_parallel`,
+        or by :meth:`.get_path_items_forked` if :attr:`.generation_processes` is.
+
         :param dict endpoints: endpoints as returned by get_endpoints
         :param ReferenceResolver components: resolver/container for Swagger References
         :param Request request: the request made against the schema view; can be None
@@ -551,8 +1002,37 @@ class OpenAPISchemaGenerator:
         prefix = self.determine_path_prefix(list(endpoints.keys())) or ""
         assert "{" not in prefix, "base path cannot be templated in swagger 2.0"
 
+        endpoints = sorted(endpoints.items())
+        processes = self.generation_processes or 0
+        threads = swagger_settings.SCHEMA_GENERATION_THREADS or 0
+        if processes > 1 and len(endpoints) > 1:
+            paths = self.get_path_items_forked(
+                endpoints, prefix, components, request, public, processes
+            )
+        elif threads > 1 and len(endpoints) > 1:
+            paths = self.get_path_items_parallel(
+                endpoints, prefix, components, request, public, threads
+            )
+        else:
+            paths = self.get_path_items(endpoints, prefix, components, request, public)
+
+        return self.get_paths_object(paths), prefix
+
+    def get_path_items(self, endpoints, prefix, components, request, public):
+        """Generate the path items of the given endpoints, in order.
+
+        :param list endpoints: ``(path, (view_cls, methods))`` pairs, as found in the
+            mapping returned by :meth:`.get_endpoints`
+        :param str prefix: common path prefix among all endpoints
+        :param ReferenceResolver components: resolver/container for Swagger References
+        :param Request request: the request made against the schema view; can be None
+        :param bool public: if True, all endpoints are included regardless of access
+            through `request`
+        :return: mapping of path suffixes to path items
+        :rtype: dict[str,openapi.PathItem]
+        """
         paths = {}
-        for path, (view_cls, methods) in sorted(endpoints.items()):
+        for path, (view_cls, methods) in endpoints:
             operations = {}
             for method, view in methods:
                 if not self.should_include_endpoint(path, method, view, public):
@@ -573,7 +1053,137 @@ class OpenAPISchemaGenerator:
                     path_suffix = "/" + path_suffix
                 paths[path_suffix] = self.get_path_item(path, view_cls, operations)
 
-        return self.get_paths_object(paths), prefix
+        return paths
+
+    def get_path_items_parallel(
+        self, endpoints, prefix, components, request, public, threads
+    ):
+        """Generate the path items of the given endpoints in a pool of `threads`
+        threads. The endpoints are split into contiguous chunks, one per thread, and
+        each chunk is generated with its own :class:`.ReferenceResolver`; the results
+        are then merged in order with :meth:`.merge_components`, so that the output is
+        identical to that of :meth:`.get_path_items`.
+
+        Arguments are the same as for :meth:`.get_path_items`.
+
+        :param int threads: number of threads to use
+        :rtype: dict[str,openapi.PathItem]
+        """
+        chunks = _split_chunks(endpoints, threads)
+
+        def generate_chunk(chunk):
+            try:
+                return self.get_path_chunk(
+                    chunk, prefix, components.scopes, request, public
+                )
+            finally:
+                # the pool threads exit when done, leaving their connections open
+                connections.close_all()
+
+        generate_chunk = bind_request_context(generate_chunk)
+        with ThreadPoolExecutor(
+            max_workers=len(chunks), thread_name_prefix="drf-yasg-paths"
+        ) as executor:
+            results = list(executor.map(generate_chunk, chunks))
+
+        return self.merge_path_chunks(components, results)
+
+    def get_path_items_forked(
+        self, endpoints, prefix, components, request, public, processes
+    ):
+        """Generate the path items of the given endpoints in `processes` forked worker
+        processes. Like in :meth:`.get_path_items_parallel`, each process generates a
+        contiguous chunk of the endpoints with its own :class:`.ReferenceResolver`,
+        and the pickled results are merged in order.
+
+        Forking is only possible on platforms that support it; elsewhere, the endpoints
+        are generated by :meth:`.get_path_items`.
+
+        Arguments are the same as for :meth:`.get_path_items`.
+
+        :param int processes: number of processes to use
+        :rtype: dict[str,openapi.PathItem]
+        """
+        if "fork" not in multiprocessing.get_all_start_methods():  # pragma: no cover
+            logger.warning("forking is not supported, generating schema serially")
+            return self.get_path_items(endpoints, prefix, components, request, public)
+
+        global _fork_state
+        chunks = _split_chunks(endpoints, processes)
+        _fork_state = (self, chunks, prefix, components.scopes, request, public)
+        try:
+            context = multiprocessing.get_context("fork")
+            with context.Pool(len(chunks)) as pool:
+                results = pool.map(_generate_forked_chunk, range(len(chunks)))
+        finally:
+            _fork_state = None
+
+        return self.merge_path_chunks(components, results)
+
+    def get_path_chunk(self, chunk, prefix, scopes, request, public):
+        """Generate the path items of a chunk of endpoints with a new
+        :class:`.ReferenceResolver`, for merging with :meth:`.merge_path_chunks`.
+
+        :param list chunk: endpoints, as passed to :meth:`.get_path_items`
+        :param str prefix: common path prefix among all endpoints
+        :param list[str] scopes: scopes of the new resolver
+        :param Request request: the request made against the schema view; can be None
+        :param bool public: if True, all endpoints are included regardless of access
+            through `request`
+        :return: the path items and the resolver holding their components
+        :rtype: tuple[dict[str,openapi.PathItem],ReferenceResolver]
+        """
+        chunk_components = self.reference_resolver_class(*scopes, force_init=True)
+        paths = self.get_path_items(chunk, prefix, chunk_components, request, public)
+        return paths, chunk_components
+
+    def merge_path_chunks(self, components, results):
+        """Merge the results of :meth:`.get_path_chunk` in order.
+
+        :param ReferenceResolver components: the resolver to merge components into
+        :param list results: the results of :meth:`.get_path_chunk`
+        :return: the path items of all chunks
+        :rtype: dict[str,openapi.PathItem]
+        """
+        paths = {}
+        for chunk_paths, chunk_components in results:
+            paths.update(chunk_paths)
+            self.merge_components(components, chunk_components)
+        return paths
+
+    def merge_components(self, components, other):
+        """Add the objects of `other` that are not yet in `components`, in order. A
+        definition generated from a different serializer than the existing one with
+        the same name is an error, unless both serializers set ``ref_name``
+        explicitly, as in :class:`~.inspectors.InlineSerializerInspector`.
+
+        :param ReferenceResolver components: the resolver to add to
+        :param ReferenceResolver other: the resolver to add from
+        """
+        for scope in other.scopes:
+            objects = other.with_scope(scope)
+            for name in objects:
+                obj = objects.get(name)
+                existing = components.getdefault(name, None, scope)
+                if existing is None:
+                    components.set(name, obj, scope)
+                    continue
+
+                existing_serializer = _get_definition_serializer(existing)
+                serializer = _get_definition_serializer(obj)
+                if (
+                    serializer
+                    and existing_serializer
+                    and serializer != existing_serializer
+                ):
+                    if not (existing_serializer[1] and serializer[1]):
+                        raise SwaggerGenerationError(
+                            "Schema for %s would override distinct serializer %s "
+                            "because they implicitly share the same ref_name; "
+                            "explicitly set the ref_name attribute on both "
+                            "serializers' Meta classes"
+                            % (existing_serializer[0], serializer[0])
+                        )
 
     def get_operation(self, view, path, prefix, method, components, request):
         """Get an :class:`.Operation` for the given API endpoint (path, method). This
@@ -606,16 +1216,161 @@ class OpenAPISchemaGenerator:
         view_inspector = view_inspector_cls(
             view, path, method, components, request, overrides, operation_keys
         )
-        operation = view_inspector.get_operation(operation_keys)
+        if not self.should_include_operation(view_inspector, operation_keys):
+            return None
+
+        cache_key = None
+        operation = None
+        if self.operation_cache is not None:
+            cache_key = self.get_operation_fingerprint(
+                view, path, prefix, method, request, overrides, view_inspector_cls
+            )
+            operation = self.get_cached_operation(cache_key, components)
+
         if operation is None:
+            operation = view_inspector.get_operation(operation_keys)
+            if operation is None:
+                return None
+
+            if "consumes" in operation and set(operation.consumes) == set(
+                self.consumes
+            ):
+                del operation.consumes
+            if "produces" in operation and set(operation.produces) == set(
+                self.produces
+            ):
+                del operation.produces
+
+            if cache_key is not None:
+                definitions = components.with_scope(openapi.SCHEMA_DEFINITIONS)
+                self.operation_cache.set(
+                    cache_key, operation, _get_used_definitions(operation, definitions)
+                )
+
+        if not self.should_include_operation(view_inspector, operation_keys, operation):
+            return None
+        return operation
+
+    def get_cached_operation(self, cache_key, components):
+        """Get an operation from :attr:`.operation_cache`, adding the definitions it
+        references to `components` if they are not there yet.
+
+        :param str cache_key: key returned by :meth:`.get_operation_fingerprint`
+        :param openapi.ReferenceResolver components: referenceable components
+        :rtype: openapi.Operation or None
+        """
+        cached = self.operation_cache.get(cache_key)
+        if cached is None:
             return None
 
-        if "consumes" in operation and set(operation.consumes) == set(self.consumes):
-            del operation.consumes
-        if "produces" in operation and set(operation.produces) == set(self.produces):
-            del operation.produces
+        operation, used_definitions = cached
+        definitions = components.with_scope(openapi.SCHEMA_DEFINITIONS)
+        for name, definition in used_definitions.items():
+            if not definitions.has(name):
+                definitions.set(name, definition)
         return operation
 
+    def get_operation_fingerprint(
+        self, view, path, prefix, method, request, overrides, view_inspector_cls
+    ):
+        """Compute the key under which the operation of an endpoint is kept in
+        :attr:`.operation_cache`. Besides the endpoint itself, the key covers
+        everything the generated operation is expected to depend on:
+
+        * the source of the modules defining the view class, its serializers (along
+          with their models and the serializers nested in them), filter backends,
+          paginator, parsers and renderers, and the inspectors used
+        * the :func:`@swagger_auto_schema <.swagger_auto_schema>` overrides
+        * the ``SWAGGER_SETTINGS`` and ``REST_FRAMEWORK`` settings
+        * the requested API version, the requesting user and the active language
+
+        Operations that depend on anything else, such as the database contents or
+        code in other modules, must not be cached.
+
+        :param view: the view associated with this endpoint
+        :param str path: the path component of the operation URL
+        :param str prefix: common path prefix among all endpoints
+        :param str method: the http method of the operation
+        :param Request request: the request made against the schema view; can be None
+        :param dict overrides: overrides as returned by :meth:`.get_overrides`
+        :param type view_inspector_cls: the view inspector class
+        :return: hex digest
+        :rtype: str
+        """
+        classes = set()
+        _add_class(classes, type(view))
+        _add_class(classes, view_inspector_cls)
+        for setting in (
+            "DEFAULT_FIELD_INSPECTORS",
+            "DEFAULT_FILTER_INSPECTORS",
+            "DEFAULT_PAGINATOR_INSPECTORS",
+        ):
+            for inspector in getattr(swagger_settings, setting):
+                _add_class(classes, inspector)
+        for attr in ("filter_backends", "parser_classes", "renderer_classes"):
+            for cls in getattr(view, attr, None) or ():
+                _add_class(classes, cls)
+        _add_class(classes, getattr(view, "pagination_class", None))
+
+        serializer = getattr(view, "serializer_class", None)
+        if hasattr(view, "get_serializer_class"):
+            try:
+                serializer = view.get_serializer_class()
+            except Exception:
+                pass
+        _add_serializer(classes, serializer)
+        _add_serializer(classes, overrides)
+
+        user = getattr(request, "user", None)
+        parts = [
+            path,
+            prefix,
+            method,
+            getattr(view, "action", None),
+            _stable_repr(overrides),
+            _stable_repr(getattr(settings, "SWAGGER_SETTINGS", None)),
+            _stable_repr(getattr(settings, "REST_FRAMEWORK", None)),
+            self.version,
+            getattr(request, "version", None),
+            getattr(user, "pk", None),
+            translation.get_language(),
+            get_module_fingerprint(__name__),
+            get_module_fingerprint(openapi.__name__),
+        ]
+        for module in sorted({cls.__module__ for cls in classes}):
+            parts.append((module, get_module_fingerprint(module)))
+        return hashlib.sha256(repr(parts).encode("utf-8")).hexdigest()
+
+    def should_include_operation(self, view_inspector, operation_keys, operation=None):
+        """Check the tags and operation id of an operation against
+        :attr:`.endpoint_filter`. This is called before the operation is generated,
+        using the ``get_tags`` and ``get_operation_id`` methods of `view_inspector`,
+        and again with the generated `operation`; inspectors that do not implement
+        those methods are only checked the second time.
+
+        :param view_inspector: the inspector that generates the operation
+        :type view_inspector: drf_yasg.inspectors.ViewInspector
+        :param list[str] operation_keys: keys as returned by
+            :meth:`.get_operation_keys`
+        :param openapi.Operation operation: the generated operation, if any
+        :rtype: bool
+        """
+        endpoint_filter = self.endpoint_filter
+        if endpoint_filter is None or not endpoint_filter.filters_operations:
+            return True
+        if operation is not None:
+            return endpoint_filter.include_operation(
+                operation.get("tags"), operation.get("operationId")
+            )
+        if not hasattr(view_inspector, "get_tags") or not hasattr(
+            view_inspector, "get_operation_id"
+        ):
+            return True
+        return endpoint_filter.include_operation(
+            view_inspector.get_tags(operation_keys),
+            view_inspector.get_operation_id(operation_keys),
+        )
+
     def get_path_item(self, path, view_cls, operations):
         """Get a :class:`.PathItem` object that describes the parameters and operations
         related to a single path in the API.
@@ -632,6 +1387,10 @@ class OpenAPISchemaGenerator:
     def get_overrides(self, view, method):
         """Get overrides specified for a given operation.
 
+        The returned dictionary is a shallow copy; its values are shared with the
+        decorated view and between operations, and must be copied before being
+        modified.
+
         :param view: the view associated with the operation
         :param str method: HTTP method
         :return: a dictionary containing any overrides set by
@@ -645,7 +1404,7 @@ class OpenAPISchemaGenerator:
         if method in overrides:
             overrides = overrides[method]
 
-        return copy.deepcopy(overrides)
+        return dict(overrides)
 
     def get_path_parameters(self, path, view_cls):
         """Return a list of Parameter instances corresponding to any templated path
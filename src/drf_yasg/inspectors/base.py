@@ -1,5 +1,7 @@
+import functools
 import inspect
 import logging
+import weakref
 
 from rest_framework import serializers
 
@@ -62,7 +64,39 @@ def call_view_method(view, method_name, fallback_attr=None, default=None):
     return default
 
 
+def _get_field_classes(inspector):
+    # field_classes only describes the field_to_swagger_object it is declared next to;
+    # a subclass overriding the method without declaring it might handle any field
+    for cls in inspect.getmro(inspector):
+        if "field_to_swagger_object" in vars(cls):
+            return vars(cls).get("field_classes")
+    return None
+
+
+@functools.lru_cache(maxsize=1024)
+def _get_field_inspectors(inspectors, field_class):
+    # the inspectors of a field_inspectors tuple that might handle instances of
+    # field_class, in the same order
+    return [
+        inspector
+        for inspector in inspectors
+        if not inspect.isclass(inspector)
+        or not issubclass(inspector, FieldInspector)
+        or _get_field_classes(inspector) is None
+        or issubclass(field_class, _get_field_classes(inspector))
+    ]
+
+
 class BaseInspector:
+    #: whether a single instance of this inspector can be used for probing all the
+    # objects inspected while generating an operation; inspectors keeping state about
+    # the object being inspected must set this to ``False``
+    reusable = True
+
+    # state shared by an inspector and all the inspectors obtained through
+    # get_inspector(), i.e. by all the inspectors used for generating an operation
+    _shared = None
+
     def __init__(self, view, path, method, components, request):
         """
         :param rest_framework.views.APIView view: the view associated with this endpoint
@@ -98,6 +132,56 @@ class BaseInspector:
         """
         return result
 
+    def _get_shared(self, name, factory):
+        shared = self._shared
+        if shared is None:
+            shared = self._shared = {}
+        value = shared.get(name)
+        if value is None:
+            value = shared[name] = factory()
+        return value
+
+    def get_inspector(self, inspector_class, initkwargs=None):
+        """Get an instance of `inspector_class` for the same view, path, method,
+        components and request as this inspector.
+
+        Instances of :attr:`.reusable` inspectors are created once and shared by this
+        inspector and all the inspectors obtained through it, i.e. once per operation
+        when called on a :class:`.ViewInspector`.
+
+        :param type[BaseInspector] inspector_class: the inspector class
+        :param dict initkwargs: extra kwargs for instantiating inspector class
+        :rtype: BaseInspector
+        """
+        initkwargs = initkwargs or {}
+        instances = self._get_shared("inspectors", dict)
+
+        key = None
+        if inspector_class.reusable:
+            key = (inspector_class,) + tuple(
+                (name, tuple(value) if isinstance(value, list) else value)
+                for name, value in sorted(initkwargs.items())
+            )
+            try:
+                inspector = instances.get(key)
+            except TypeError:  # pragma: no cover
+                key = inspector = None
+            if inspector is not None:
+                return inspector
+
+        inspector = inspector_class(
+            self.view,
+            self.path,
+            self.method,
+            self.components,
+            self.request,
+            **initkwargs,
+        )
+        inspector._shared = self._shared
+        if key is not None:
+            instances[key] = inspector
+        return inspector
+
     def probe_inspectors(self, inspectors, method_name, obj, initkwargs=None, **kwargs):
         """Probe a list of inspectors with a given object. The first inspector in the
         list to return a value that is not :data:`.NotHandled` wins.
@@ -110,7 +194,6 @@ class BaseInspector:
         :return: the return value of the winning inspector, or ``None`` if no inspector
             handled the object
         """
-        initkwargs = initkwargs or {}
         tried_inspectors = []
 
         for inspector in inspectors:
@@ -121,14 +204,7 @@ class BaseInspector:
                 "inspectors must subclass BaseInspector"
             )
 
-            inspector = inspector(
-                self.view,
-                self.path,
-                self.method,
-                self.components,
-                self.request,
-                **initkwargs,
-            )
+            inspector = self.get_inspector(inspector, initkwargs)
             tried_inspectors.append(inspector)
             method = getattr(inspector, method_name, None)
             if method is None:
@@ -147,6 +223,9 @@ class BaseInspector:
             result = None
 
         for inspector in reversed(tried_inspectors):
+            if type(inspector).process_result is BaseInspector.process_result:
+                # the default implementation returns the result unchanged
+                continue
             result = inspector.process_result(result, method_name, obj, **kwargs)
 
         return result
@@ -224,6 +303,12 @@ class FilterInspector(BaseInspector):
 class FieldInspector(BaseInspector):
     """Base inspector for serializers and serializer fields."""
 
+    #: field or serializer classes whose instances :meth:`.field_to_swagger_object` can
+    # handle; it is not called for other fields, which also skips
+    # :meth:`.process_result`. ``None`` means that any field might be handled. Only
+    # taken into account on the class that defines ``field_to_swagger_object``.
+    field_classes = None
+
     def __init__(self, view, path, method, components, request, field_inspectors):
         super(FieldInspector, self).__init__(view, path, method, components, request)
         self.field_inspectors = field_inspectors
@@ -267,7 +352,8 @@ class FieldInspector(BaseInspector):
         self, field, swagger_object_type, use_references, **kwargs
     ):
         """Helper method for recursively probing `field_inspectors` to handle a given
-        field.
+        field. Inspectors whose :attr:`.field_classes` do not match the class of `field`
+        are skipped.
 
         All arguments are the same as :meth:`.field_to_swagger_object`.
 
@@ -275,7 +361,7 @@ class FieldInspector(BaseInspector):
             openapi.SchemaRef
         """
         return self.probe_inspectors(
-            self.field_inspectors,
+            _get_field_inspectors(tuple(self.field_inspectors), type(field)),
             "field_to_swagger_object",
             field,
             {"field_inspectors": self.field_inspectors},
@@ -284,6 +370,27 @@ class FieldInspector(BaseInspector):
             **kwargs,
         )
 
+    def _get_field_attributes(self, field):
+        # the title and description of field, and its default once it is needed; they
+        # are computed once per field and shared by all the inspectors used for
+        # generating an operation, since all of them call _get_partial_types()
+        memo = self._get_shared("field_attributes", weakref.WeakKeyDictionary)
+        try:
+            attributes = memo.get(field)
+        except TypeError:  # pragma: no cover
+            # not weakly referenceable
+            attributes = memo = None
+
+        if attributes is None:
+            help_text = getattr(field, "help_text", None)
+            attributes = {
+                "title": force_real_str(field.label) if field.label else None,
+                "description": force_real_str(help_text) if help_text else None,
+            }
+            if memo is not None:
+                memo[field] = attributes
+        return attributes
+
     def _get_partial_types(self, field, swagger_object_type, use_references, **kwargs):
         """Helper method to extract generic information from a field and return a
         partial constructor for the appropriate openapi object.
@@ -322,14 +429,12 @@ class FieldInspector(BaseInspector):
         assert not isinstance(field, openapi.SwaggerDict), (
             "passed field is already a SwaggerDict object"
         )
-        title = force_real_str(field.label) if field.label else None
+        attributes = self._get_field_attributes(field)
         title = (
-            title if swagger_object_type == openapi.Schema else None
+            attributes["title"] if swagger_object_type == openapi.Schema else None
         )  # only Schema has title
-        help_text = getattr(field, "help_text", None)
-        description = force_real_str(help_text) if help_text else None
         description = (
-            description if swagger_object_type != openapi.Items else None
+            attributes["description"] if swagger_object_type != openapi.Items else None
         )  # Items has no description either
 
         def SwaggerType(existing_object=None, use_field_title=True, **instance_kwargs):
@@ -343,7 +448,9 @@ class FieldInspector(BaseInspector):
                 "default" not in instance_kwargs
                 and swagger_object_type != openapi.Items
             ):
-                default = get_field_default(field)
+                if "default" not in attributes:
+                    attributes["default"] = get_field_default(field)
+                default = attributes["default"]
                 if default not in (None, serializers.empty):
                     instance_kwargs["default"] = default
 
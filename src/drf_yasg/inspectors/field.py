@@ -1,4 +1,5 @@
 import datetime
+import functools
 import inspect
 import logging
 import operator
@@ -40,6 +41,12 @@ class InlineSerializerInspector(SerializerInspector):
     """Provides serializer conversions using
     :meth:`.FieldInspector.field_to_swagger_object`."""
 
+    field_classes = (
+        serializers.ListSerializer,
+        serializers.ListField,
+        serializers.Serializer,
+    )
+
     #: whether to output :class:`.Schema` definitions inline or into the ``definitions``
     # section
     use_definitions = False
@@ -93,6 +100,15 @@ class InlineSerializerInspector(SerializerInspector):
     def field_to_swagger_object(
         self, field, swagger_object_type, use_references, **kwargs
     ):
+        if use_references and isinstance(field, serializers.Serializer):
+            # a serializer class whose definition was already added during this
+            # generation is referenced without inspecting it again
+            memo_key = (InlineSerializerInspector, type(self), type(field))
+            ref_name = self.components.memo.get(memo_key)
+            if ref_name is not None and swagger_object_type == openapi.Schema:
+                definitions = self.components.with_scope(openapi.SCHEMA_DEFINITIONS)
+                return openapi.SchemaRef(definitions, ref_name)
+
         SwaggerType, ChildSwaggerType = self._get_partial_types(
             field, swagger_object_type, use_references, **kwargs
         )
@@ -161,6 +177,9 @@ class InlineSerializerInspector(SerializerInspector):
                         % (actual_serializer, this_serializer)
                     )
 
+            self.components.memo[
+                (InlineSerializerInspector, type(self), this_serializer)
+            ] = ref_name
             return openapi.SchemaRef(definitions, ref_name)
 
         return NotHandled
@@ -265,6 +284,8 @@ def get_related_model(model, source):
 class RelatedFieldInspector(FieldInspector):
     """Provides conversions for ``RelatedField``\\ s."""
 
+    field_classes = (serializers.RelatedField, serializers.ManyRelatedField)
+
     def field_to_swagger_object(
         self, field, swagger_object_type, use_references, **kwargs
     ):
@@ -570,6 +591,7 @@ hinting_type_info = [
 typing_get_args = typing.get_args
 typing_get_origin = typing.get_origin
 
+
 def inspect_collection_hint_class(hint_class):
     args = typing_get_args(hint_class)
     child_class = args[0] if args else str
@@ -639,6 +661,8 @@ class SerializerMethodFieldInspector(FieldInspector):
     the swagger_serializer_method decorator.
     """
 
+    field_classes = (serializers.SerializerMethodField,)
+
     def field_to_swagger_object(  # noqa: C901
         self, field, swagger_object_type, use_references, **kwargs
     ):
@@ -774,6 +798,8 @@ class SimpleFieldInspector(FieldInspector):
 class ChoiceFieldInspector(FieldInspector):
     """Provides conversions for ``ChoiceField`` and ``MultipleChoiceField``."""
 
+    field_classes = (serializers.ChoiceField,)
+
     def field_to_swagger_object(
         self, field, swagger_object_type, use_references, **kwargs
     ):
@@ -836,6 +862,8 @@ class ChoiceFieldInspector(FieldInspector):
 class FileFieldInspector(FieldInspector):
     """Provides conversions for ``FileField``\\ s."""
 
+    field_classes = (serializers.FileField,)
+
     def field_to_swagger_object(
         self, field, swagger_object_type, use_references, **kwargs
     ):
@@ -872,6 +900,8 @@ class FileFieldInspector(FieldInspector):
 class DictFieldInspector(FieldInspector):
     """Provides conversion for ``DictField``."""
 
+    field_classes = (serializers.DictField,)
+
     def field_to_swagger_object(
         self, field, swagger_object_type, use_references, **kwargs
     ):
@@ -896,6 +926,8 @@ class DictFieldInspector(FieldInspector):
 class HiddenFieldInspector(FieldInspector):
     """Hide ``HiddenField``."""
 
+    field_classes = (serializers.HiddenField,)
+
     def field_to_swagger_object(
         self, field, swagger_object_type, use_references, **kwargs
     ):
@@ -908,6 +940,8 @@ class HiddenFieldInspector(FieldInspector):
 class JSONFieldInspector(FieldInspector):
     """Provides conversion for ``JSONField``."""
 
+    field_classes = (serializers.JSONField,)
+
     def field_to_swagger_object(
         self, field, swagger_object_type, use_references, **kwargs
     ):
@@ -948,6 +982,11 @@ except ImportError:  # pragma: no cover
         return data
 
 
+@functools.lru_cache(maxsize=4096)
+def _camelize_string(s):
+    return next(iter(camelize({s: ""})))
+
+
 class CamelCaseJSONFilter(FieldInspector):
     """Converts property names to camelCase if ``djangorestframework_camel_case`` is
     used."""
@@ -959,15 +998,23 @@ class CamelCaseJSONFilter(FieldInspector):
         :return: camelized string
         :rtype: str
         """
-        return next(iter(camelize({s: ""})))
+        return _camelize_string(s)
 
     def camelize_schema(self, schema):
         """Recursively camelize property names for the given schema using
         ``djangorestframework_camel_case``.
         The target schema object must be modified in-place.
 
+        Schemas are marked once camelized, so that definitions are only camelized the
+        first time they are referenced.
+
         :param openapi.Schema schema: the :class:`.Schema` object
         """
+        if getattr(schema, "_NP_camelized", False):
+            return
+        if isinstance(schema, openapi.SwaggerDict):
+            schema._NP_camelized = True
+
         if getattr(schema, "properties", {}):
             schema.properties = {
                 self.camelize_string(key): self.camelize_schema(
@@ -990,13 +1037,28 @@ class CamelCaseJSONFilter(FieldInspector):
     if CamelCaseJSONParser and CamelCaseJSONRenderer:
 
         def is_camel_case(self):
-            return any(
+            # instantiating the parsers and renderers of the view is done once per view
+            # class, action and method for each generated schema
+            memo = getattr(self.components, "memo", None)
+            key = (
+                CamelCaseJSONFilter,
+                type(self.view),
+                getattr(self.view, "action", None),
+                self.method,
+            )
+            if memo is not None and key in memo:
+                return memo[key]
+
+            camel_case = any(
                 issubclass(parser, CamelCaseJSONParser)
                 for parser in self.get_parser_classes()
             ) or any(
                 issubclass(renderer, CamelCaseJSONRenderer)
                 for renderer in self.get_renderer_classes()
             )
+            if memo is not None:
+                memo[key] = camel_case
+            return camel_case
     else:
 
         def is_camel_case(self):
@@ -1016,6 +1078,8 @@ else:
     class RecursiveFieldInspector(FieldInspector):
         """Provides conversion for RecursiveField (https://github.com/heywbj/django-rest-framework-recursive)"""
 
+        field_classes = (RecursiveField,)
+
         def field_to_swagger_object(
             self, field, swagger_object_type, use_references, **kwargs
         ):
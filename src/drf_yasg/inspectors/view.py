@@ -1,3 +1,4 @@
+import copy
 import logging
 
 from rest_framework.request import is_form_media_type
@@ -307,6 +308,9 @@ class SwaggerAutoSchema(ViewInspector):
                 if hasattr(response, "schema") and not isinstance(
                     response.schema, openapi.Schema.OR_REF
                 ):
+                    # the Response comes from the overrides, which are shared between
+                    # operations; replace the schema on a copy
+                    response = copy.copy(response)
                     serializer = force_serializer_instance(response.schema)
                     response.schema = self.serializer_to_schema(serializer)
             elif isinstance(serializer, openapi.Schema.OR_REF):
@@ -1,9 +1,11 @@
+import cProfile
 import logging
 import os
+from contextlib import contextmanager, nullcontext
 
 from django.contrib.auth import get_user_model
 from django.core.exceptions import ImproperlyConfigured
-from django.core.management.base import BaseCommand
+from django.core.management.base import BaseCommand, CommandError
 from django.utils.module_loading import import_string
 from rest_framework.settings import api_settings
 from rest_framework.test import APIRequestFactory, force_authenticate
@@ -11,7 +13,9 @@ from rest_framework.views import APIView
 
 from ... import openapi
 from ...app_settings import swagger_settings
+from ...caching import OperationCache
 from ...codecs import OpenAPICodecJson, OpenAPICodecYaml
+from ...profiling import SchemaProfiler
 
 
 class Command(BaseCommand):
@@ -96,6 +100,50 @@ class Command(BaseCommand):
             help="Import string pointing to an OpenAPISchemaGenerator subclass to use "
             "for schema generation.",
         )
+        parser.add_argument(
+            "-j",
+            "--jobs",
+            dest="jobs",
+            default=1,
+            type=int,
+            help="Number of processes to generate the schema with. The endpoints are "
+            "split between forked worker processes, and the output is the same as "
+            "with a single process. Only supported on platforms that can fork.",
+        )
+        parser.add_argument(
+            "--cache-dir",
+            dest="cache_dir",
+            default="",
+            type=str,
+            help="Directory in which generated operations are kept between runs. "
+            "Operations of views whose code, serializers and settings did not change "
+            "since the previous run are read from it instead of being generated again.",
+        )
+        parser.add_argument(
+            "--profile",
+            dest="profile",
+            default=False,
+            action="store_true",
+            help="Time each stage of schema generation and encoding, and write a "
+            "report of the slowest stages, endpoints and serializers to stderr.",
+        )
+        parser.add_argument(
+            "--profile-format",
+            dest="profile_format",
+            default="text",
+            choices=["text", "json"],
+            type=str,
+            help="Format of the --profile report.",
+        )
+        parser.add_argument(
+            "--profile-stats",
+            dest="profile_stats",
+            default="",
+            type=str,
+            help="Run the command under cProfile and write its statistics to this "
+            "path, in the pstats format read by snakeviz, gprof2dot, flameprof and the "
+            "like. This option implies --profile.",
+        )
 
     def write_schema(self, schema, stream, format):
         if format == "json":
@@ -135,6 +183,18 @@ class Command(BaseCommand):
     def get_schema(self, generator, request, public):
         return generator.get_schema(request=request, public=public)
 
+    @contextmanager
+    def profile_generation(self, generator, profile_format, profile_stats):
+        profiler = SchemaProfiler()
+        with profiler.instrument(generator):
+            if profile_stats:
+                with cProfile.Profile() as stats:
+                    yield
+                stats.dump_stats(profile_stats)
+            else:
+                yield
+        self.stderr.write(profiler.format_report(profile_format))
+
     def handle(
         self,
         output_file,
@@ -146,6 +206,11 @@ class Command(BaseCommand):
         user,
         private,
         generator_class_name,
+        jobs,
+        cache_dir,
+        profile,
+        profile_format,
+        profile_stats,
         *args,
         **kwargs,
     ):
@@ -166,6 +231,13 @@ class Command(BaseCommand):
 
         api_url = api_url or swagger_settings.DEFAULT_API_URL
 
+        profile = profile or bool(profile_stats)
+        if profile and jobs > 1:
+            raise CommandError(
+                "--profile cannot be used with --jobs, since the worker processes "
+                "are not profiled"
+            )
+
         if user:
             # Only call get_user_model if --user was passed in order to
             # avoid crashing if auth is not configured in the project
@@ -191,11 +263,22 @@ class Command(BaseCommand):
         generator = self.get_schema_generator(
             generator_class_name, info, api_version, api_url
         )
-        schema = self.get_schema(generator, request, not private)
+        if jobs > 1:
+            generator.generation_processes = jobs
+        if cache_dir:
+            generator.operation_cache = OperationCache(cache_dir)
+
+        profiling = nullcontext()
+        if profile:
+            profiling = self.profile_generation(
+                generator, profile_format, profile_stats
+            )
+        with profiling:
+            schema = self.get_schema(generator, request, not private)
 
-        if output_file == "-":
-            self.write_schema(schema, self.stdout, format)
-        else:
-            flags = "w" if overwrite else "x"
-            with open(output_file, flags) as stream:
-                self.write_schema(schema, stream, format)
+            if output_file == "-":
+                self.write_schema(schema, self.stdout, format)
+            else:
+                flags = "w" if overwrite else "x"
+                with open(output_file, flags) as stream:
+                    self.write_schema(schema, stream, format)
@@ -699,6 +699,34 @@ def resolve_ref(ref_or_obj, resolver):
     return ref_or_obj
 
 
+def get_referenced_definitions(obj, definitions):
+    """Find the names of all definitions that are reachable from `obj` through
+    ``#/definitions/`` references, following references inside the definitions
+    themselves.
+
+    :param obj: object to search for references, e.g. a :class:`.Paths` object
+    :param dict[str,Schema] definitions: the named models references are resolved in
+    :return: names of the referenced definitions
+    :rtype: set[str]
+    """
+    prefix = "#/" + SCHEMA_DEFINITIONS + "/"
+    referenced = set()
+    stack = [obj]
+    while stack:
+        obj = stack.pop()
+        if isinstance(obj, dict):
+            ref = obj.get("$ref")
+            if isinstance(ref, str) and ref.startswith(prefix):
+                name = ref[len(prefix) :]
+                if name not in referenced and name in definitions:
+                    referenced.add(name)
+                    stack.append(definitions[name])
+            stack.extend(obj.values())
+        elif isinstance(obj, (list, tuple)):
+            stack.extend(obj)
+    return referenced
+
+
 class Responses(SwaggerDict):
     def __init__(self, responses, default=None, **extra):
         """Describes the expected responses of an :class:`.Operation`.
@@ -767,6 +795,10 @@ class ReferenceResolver(object):
 
         self._objects = {}
         self._force_scope = None
+        #: values kept by inspectors for as long as this resolver is used, i.e. for
+        # the generation of one schema; shared with the views returned by
+        # :meth:`.with_scope` and not pickled
+        self.memo = {}
         for scope in scopes:
             assert isinstance(scope, str), "scope names must be strings"
             self._objects[scope] = {}
@@ -783,6 +815,7 @@ class ReferenceResolver(object):
         ret = ReferenceResolver(force_init=True)
         ret._objects = self._objects
         ret._force_scope = scope
+        ret.memo = self.memo
         return ret
 
     def _check_scope(self, scope):
@@ -896,3 +929,8 @@ class ReferenceResolver(object):
 
     def __str__(self):
         return str(dict(self))
+
+    def __getstate__(self):
+        state = dict(vars(self))
+        state["memo"] = {}
+        return state
@@ -0,0 +1,231 @@
+import functools
+import json
+import threading
+import time
+from contextlib import contextmanager
+
+from rest_framework import serializers
+
+from .app_settings import swagger_settings
+from .codecs import OpenAPICodecJson, OpenAPICodecYaml, _OpenAPICodec
+from .inspectors import SwaggerAutoSchema, ViewInspector
+
+
+class SchemaProfiler:
+    """Measures the time spent in each stage of schema generation, and in generating
+    each endpoint and serializer. Used by the ``generate_swagger`` command's
+    ``--profile`` option.
+
+    Stages are measured by temporarily wrapping methods of the generator, the endpoint
+    enumerator, the view inspectors and the codecs, see :meth:`.instrument`. A stage
+    entered again while it is already running (e.g. the recursive URLconf enumeration)
+    is only counted once.
+    """
+
+    #: methods of the generator instance, mapped to the stage they are counted in
+    generator_stages = {
+        "create_view": "create_view",
+        "should_include_endpoint": "permissions",
+        "get_operation": "get_operation",
+    }
+    #: methods of the view inspector classes, mapped to the stage they are counted in
+    inspector_stages = {
+        "get_request_body_parameters": "request_body",
+        "get_query_parameters": "query_parameters",
+        "get_responses": "responses",
+        "serializer_to_schema": "serializer_to_schema",
+    }
+    #: methods of the codec classes, mapped to the stage they are counted in
+    codec_stages = {
+        "generate_swagger_object": "as_dict",
+        "_dump_dict": "encoding",
+    }
+
+    def __init__(self):
+        self.stages = {}
+        self.endpoints = {}
+        self.serializers = {}
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._patches = []
+
+    def add(self, table, name, seconds):
+        """Add a call that took `seconds` to the entry `name` of `table`.
+
+        :param dict table: one of :attr:`.stages`, :attr:`.endpoints` or
+            :attr:`.serializers`
+        :param str name: name of the entry
+        :param float seconds: duration of the call
+        """
+        with self._lock:
+            entry = table.setdefault(name, [0.0, 0])
+            entry[0] += seconds
+            entry[1] += 1
+
+    @contextmanager
+    def measure(self, stage, table=None, name=None):
+        """Context manager counting the time spent inside it in `stage`, and in the
+        entry `name` of `table` if given.
+
+        :param str stage: name of the stage
+        :param dict table: :attr:`.endpoints` or :attr:`.serializers`
+        :param str name: name of the entry in `table`
+        """
+        active = getattr(self._local, "active", None)
+        if active is None:
+            active = self._local.active = set()
+        if stage in active:
+            yield
+            return
+
+        active.add(stage)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            active.discard(stage)
+            self.add(self.stages, stage, elapsed)
+            if table is not None:
+                self.add(table, name, elapsed)
+
+    def wrap(self, obj, attr, stage, get_entry=None):
+        """Replace the method `attr` of `obj` with one measured in `stage`, until
+        :meth:`.restore` is called.
+
+        :param obj: a class or an instance
+        :param str attr: name of the method
+        :param str stage: name of the stage
+        :param get_entry: callable receiving the arguments of the method and returning
+            a ``(table, name)`` tuple, or ``None``
+        """
+        method = getattr(obj, attr)
+
+        @functools.wraps(method)
+        def wrapper(*args, **kwargs):
+            table, name = get_entry(*args, **kwargs) if get_entry else (None, None)
+            with self.measure(stage, table, name):
+                return method(*args, **kwargs)
+
+        self._patches.append((obj, attr, vars(obj).get(attr), attr in vars(obj)))
+        setattr(obj, attr, wrapper)
+
+    def restore(self):
+        """Undo all the replacements done by :meth:`.wrap`."""
+        while self._patches:
+            obj, attr, original, existed = self._patches.pop()
+            if existed:
+                setattr(obj, attr, original)
+            else:
+                delattr(obj, attr)
+
+    def get_endpoint_entry(self, view, path, prefix, method, *args, **kwargs):
+        return self.endpoints, "%s %s" % (method.upper(), path)
+
+    def get_serializer_entry(self, inspector, serializer, *args, **kwargs):
+        many = isinstance(serializer, serializers.ListSerializer)
+        if many:
+            serializer = serializer.child
+        serializer_class = (
+            serializer if isinstance(serializer, type) else type(serializer)
+        )
+        name = "%s.%s" % (serializer_class.__module__, serializer_class.__qualname__)
+        return self.serializers, name + ("(many=True)" if many else "")
+
+    @contextmanager
+    def instrument(self, generator):
+        """Context manager measuring the schema generation done by `generator`, and the
+        encoding done by the JSON and YAML codecs, while it is active.
+
+        Inspector methods are wrapped on :class:`.SwaggerAutoSchema`, on
+        :class:`.ViewInspector` and on the
+        :ref:`DEFAULT_AUTO_SCHEMA_CLASS <default-class-settings>`; view inspectors
+        overriding them without calling ``super()`` are not measured.
+
+        :param .OpenAPISchemaGenerator generator: the generator to measure
+        """
+        try:
+            self.wrap(
+                generator.endpoint_enumerator_class, "get_api_endpoints", "enumeration"
+            )
+            for attr, stage in self.generator_stages.items():
+                get_entry = (
+                    self.get_endpoint_entry if stage == "get_operation" else None
+                )
+                self.wrap(generator, attr, stage, get_entry)
+
+            inspector_classes = [ViewInspector, SwaggerAutoSchema]
+            default_class = swagger_settings.DEFAULT_AUTO_SCHEMA_CLASS
+            if default_class not in inspector_classes:
+                inspector_classes.append(default_class)
+            for inspector_class in inspector_classes:
+                for attr, stage in self.inspector_stages.items():
+                    if attr not in vars(inspector_class):
+                        continue
+                    get_entry = None
+                    if stage == "serializer_to_schema":
+                        get_entry = self.get_serializer_entry
+                    self.wrap(inspector_class, attr, stage, get_entry)
+
+            for codec_class in (_OpenAPICodec, OpenAPICodecJson, OpenAPICodecYaml):
+                for attr, stage in self.codec_stages.items():
+                    if attr in vars(codec_class):
+                        self.wrap(codec_class, attr, stage)
+
+            with self.measure("total"):
+                yield self
+        finally:
+            self.restore()
+
+    def get_report(self, limit=None):
+        """Return the collected timings, each table sorted from the slowest entry.
+
+        :param int limit: maximum number of endpoints and serializers to include
+        :return: a JSON-serializable dictionary with ``stages``, ``endpoints`` and
+            ``serializers`` lists of ``{"name", "seconds", "calls"}`` objects
+        :rtype: dict
+        """
+
+        def sort_table(table, count=None):
+            with self._lock:
+                entries = sorted(table.items(), key=lambda item: -item[1][0])
+            return [
+                {"name": name, "seconds": round(seconds, 6), "calls": calls}
+                for name, (seconds, calls) in entries[:count]
+            ]
+
+        return {
+            "stages": sort_table(self.stages),
+            "endpoints": sort_table(self.endpoints, limit),
+            "serializers": sort_table(self.serializers, limit),
+        }
+
+    def format_report(self, format="text", limit=20):
+        """Format the collected timings as human-readable tables, or as JSON including
+        all endpoints and serializers.
+
+        :param str format: ``text`` or ``json``
+        :param int limit: maximum number of endpoints and serializers in the tables
+        :rtype: str
+        """
+        if format == "json":
+            return json.dumps(self.get_report(), indent=4)
+
+        report = self.get_report(limit)
+
+        lines = []
+        for title, key in (
+            ("Stage", "stages"),
+            ("Endpoint", "endpoints"),
+            ("Serializer", "serializers"),
+        ):
+            entries = report[key]
+            width = max([len(title)] + [len(entry["name"]) for entry in entries])
+            lines.append("%-*s %8s %10s" % (width, title, "Calls", "Seconds"))
+            for entry in entries:
+                lines.append(
+                    "%-*s %8d %10.4f"
+                    % (width, entry["name"], entry["calls"], entry["seconds"])
+                )
+            lines.append("")
+        return "\n".join(lines)
@@ -1,6 +1,11 @@
+import gzip
+import hashlib
+
 from django.core.exceptions import ImproperlyConfigured
 from django.shortcuts import resolve_url
 from django.template.loader import render_to_string
+from django.utils import translation
+from django.utils.cache import patch_vary_headers
 from django.utils.encoding import force_str
 from django.utils.functional import Promise
 from rest_framework.renderers import BaseRenderer, JSONRenderer, TemplateHTMLRenderer
@@ -11,6 +16,46 @@ from .codecs import VALIDATORS, OpenAPICodecJson, OpenAPICodecYaml
 from .openapi import Swagger
 from .utils import filter_none
 
+try:
+    import brotli
+except ImportError:  # pragma: no cover
+    brotli = None
+
+
+def _gzip_compress(content):
+    # mtime is fixed so that compressing the same content is deterministic
+    return gzip.compress(content, mtime=0)
+
+
+#: available content codings for precompressed specs, in order of preference
+COMPRESSORS = {"gzip": _gzip_compress}
+if brotli is not None:  # pragma: no cover
+    COMPRESSORS = {"br": brotli.compress, **COMPRESSORS}
+
+
+def get_accepted_encodings(accept_encoding):
+    """Parse an ``Accept-Encoding`` header into the quality value of each listed content
+    coding. Codings refused with ``q=0`` are kept, so that they can be told apart from
+    codings that are only accepted through ``*``.
+
+    :param str accept_encoding: the header value
+    :rtype: dict[str,float]
+    """
+    qualities = {}
+    for item in accept_encoding.split(","):
+        coding, _, params = item.partition(";")
+        coding = coding.strip().lower()
+        quality = 1.0
+        param, _, value = params.partition("=")
+        if param.strip().lower() == "q":
+            try:
+                quality = float(value)
+            except ValueError:
+                quality = 0.0
+        if coding:
+            qualities[coding] = quality
+    return qualities
+
 
 class _SpecRenderer(BaseRenderer):
     """Base class for text renderers. Handles encoding and validation."""
@@ -28,7 +73,6 @@ class _SpecRenderer(BaseRenderer):
 
     def render(self, data, media_type=None, renderer_context=None):
         assert self.codec_class, "must override codec_class"
-        codec = self.codec_class(self.validators)
 
         if not isinstance(data, Swagger):  # pragma: no cover
             # if `swagger` is not a ``Swagger`` object, it means we somehow got a
@@ -37,7 +81,109 @@ class _SpecRenderer(BaseRenderer):
             # see https://github.com/axnsan12/drf-yasg/issues/58
             return JSONRenderer().render(data, media_type, renderer_context)
 
-        return codec.encode(data)
+        request = renderer_context.get("request") if renderer_context else None
+        content_encoding = self.get_content_encoding(request)
+        if content_encoding is None:
+            return self.encode(data)
+
+        response = renderer_context.get("response")
+        if response is not None:
+            response["Content-Encoding"] = content_encoding
+            patch_vary_headers(response, ("Accept-Encoding",))
+        return self.compress(data, content_encoding)
+
+    def get_content_encoding(self, request):
+        """Choose a content coding for the response to `request` among
+        :data:`.COMPRESSORS`, if the :ref:`PRECOMPRESS_SPEC <schema-cache-settings>`
+        setting is enabled.
+
+        :param request: the request being answered; can be None
+        :return: the content coding, or ``None`` if the spec should not be compressed
+        :rtype: str or None
+        """
+        if request is None or not swagger_settings.PRECOMPRESS_SPEC:
+            return None
+
+        qualities = get_accepted_encodings(request.META.get("HTTP_ACCEPT_ENCODING", ""))
+        wildcard_quality = qualities.get("*", 0.0)
+        for content_encoding in COMPRESSORS:
+            if qualities.get(content_encoding, wildcard_quality) > 0:
+                return content_encoding
+        return None
+
+    def get_codec(self):
+        """Instantiate the codec used for encoding the schema.
+
+        :rtype: drf_yasg.codecs._OpenAPICodec
+        """
+        return self.codec_class(self.validators)
+
+    def _get_encoding(self, swagger):
+        codec = self.get_codec()
+        cache_key = (
+            type(codec),
+            tuple(codec.validators),
+            getattr(codec, "pretty", False),
+            # lazy translation strings are resolved when encoding
+            translation.get_language(),
+        )
+
+        encodings = getattr(swagger, "_NP_encodings", None)
+        if encodings is None:
+            encodings = swagger._NP_encodings = {}
+        encoding = encodings.get(cache_key)
+        if encoding is None:
+            # prebuilt spec files (see load_static_spec) are served as they are
+            static_content = getattr(swagger, "_NP_static_content", {})
+            content = static_content.get(type(codec))
+            if content is None:
+                content = codec.encode(swagger)
+            encoding = encodings[cache_key] = {"content": content}
+        return encoding
+
+    def encode(self, swagger):
+        """Encode `swagger` using :meth:`.get_codec`.
+
+        The encoded bytes are memoized on the ``Swagger`` object itself, keyed by codec
+        class, validators and pretty flag, so that a cached schema is serialized only
+        once per encoding. The object must not be modified after it was rendered.
+
+        :param Swagger swagger: the schema to encode
+        :rtype: bytes
+        """
+        return self._get_encoding(swagger)["content"]
+
+    def compress(self, swagger, content_encoding):
+        """Encode `swagger` and compress it with the given content coding. Like the
+        encoded bytes, the compressed bytes are memoized on the ``Swagger`` object, so
+        each variant is compressed only once.
+
+        :param Swagger swagger: the schema to encode
+        :param str content_encoding: one of the keys of :data:`.COMPRESSORS`
+        :rtype: bytes
+        """
+        encoding = self._get_encoding(swagger)
+        if content_encoding not in encoding:
+            compressor = COMPRESSORS[content_encoding]
+            encoding[content_encoding] = compressor(encoding["content"])
+        return encoding[content_encoding]
+
+    def get_etag(self, swagger, content_encoding=None):
+        """Compute a strong ``ETag`` from the bytes returned by :meth:`.encode`. The
+        result is memoized along with the encoded bytes.
+
+        :param Swagger swagger: the schema to encode
+        :param str content_encoding: content coding of the response, if compressed;
+            each compressed variant gets a distinct entity tag
+        :return: the quoted entity tag
+        :rtype: str
+        """
+        encoding = self._get_encoding(swagger)
+        if "etag" not in encoding:
+            encoding["etag"] = hashlib.sha256(encoding["content"]).hexdigest()
+        if content_encoding:
+            return '"%s-%s"' % (encoding["etag"], content_encoding)
+        return '"%s"' % encoding["etag"]
 
 
 class OpenAPIRenderer(_SpecRenderer):
@@ -176,6 +322,7 @@ class SwaggerUIRenderer(_UIRenderer):
             "refetchWithAuth": swagger_settings.REFETCH_SCHEMA_WITH_AUTH,
             "refetchOnLogout": swagger_settings.REFETCH_SCHEMA_ON_LOGOUT,
             "fetchSchemaWithQuery": swagger_settings.FETCH_SCHEMA_WITH_QUERY,
+            "lazyLoadSpec": swagger_settings.LAZY_LOAD_SPEC,
             "csrfCookie": swagger_settings.CSRF_COOKIE_NAME,
             # remove HTTP_ and convert underscores to dashes
             "csrfHeader": swagger_settings.CSRF_HEADER_NAME[5:].replace("_", "-"),
@@ -210,6 +357,7 @@ class ReDocRenderer(_UIRenderer):
             "nativeScrollbars": redoc_settings.NATIVE_SCROLLBARS,
             "requiredPropsFirst": redoc_settings.REQUIRED_PROPS_FIRST,
             "fetchSchemaWithQuery": redoc_settings.FETCH_SCHEMA_WITH_QUERY,
+            "lazyLoadSpec": redoc_settings.LAZY_LOAD_SPEC,
             "hideDownloadButton": redoc_settings.HIDE_DOWNLOAD_BUTTON,
         }
 
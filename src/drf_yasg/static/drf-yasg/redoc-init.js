@@ -27,6 +27,18 @@ if (redocSettings.fetchSchemaWithQuery) {
 }
 delete redocSettings.fetchSchemaWithQuery;
 
+var lazyLoadSpec = redocSettings.lazyLoadSpec;
+delete redocSettings.lazyLoadSpec;
+var fullSpecURL = specURL;
+if (lazyLoadSpec) {
+    // render the spec index first, then replace it with the full spec once loaded (see loadFullSpec)
+    var indexURL = specURL.split('?');
+    var indexUsp = new URLSearchParams(indexURL[1] || '');
+    indexUsp.set('index', '1');
+    indexURL[1] = indexUsp.toString();
+    specURL = indexURL.join('?');
+}
+
 redoc.setAttribute("spec-url", specURL);
 
 function camelToKebab(str) {
@@ -43,6 +55,42 @@ for (var p in redocSettings) {
 
 document.body.replaceChild(redoc, document.getElementById('redoc-placeholder'));
 
+/**
+ * Replace the spec index rendered first in lazy mode with the full spec. ReDoc can only render whole documents, so
+ * this re-initializes it once the full spec has been downloaded.
+ */
+function loadFullSpec() {
+    if (!window.Redoc || !window.Redoc.init) {
+        console.log("WARNING: this version of ReDoc cannot be re-initialized; LAZY_LOAD_SPEC is not supported");
+        return;
+    }
+
+    var redocOptions = {};
+    for (var p in redocSettings) {
+        if (redocSettings.hasOwnProperty(p) && redocSettings[p] !== null && redocSettings[p] !== undefined) {
+            redocOptions[p] = redocSettings[p];
+        }
+    }
+
+    fetch(fullSpecURL, {credentials: 'same-origin', headers: {'Accept': 'application/json'}})
+        .then(function (response) {
+            if (!response.ok) {
+                throw new Error(response.status + " " + response.statusText);
+            }
+            return response.json();
+        })
+        .then(function (spec) {
+            Redoc.init(spec, redocOptions, redoc);
+        })
+        .catch(function (error) {
+            console.log("WARNING: failed to load the full spec", error);
+        });
+}
+
+if (lazyLoadSpec) {
+    window.addEventListener('load', loadFullSpec);
+}
+
 function hideEmptyVersion() {
     // 'span.api-info-version' is for redoc 1.x, 'div.api-info span' is for redoc 2-alpha
     var apiVersion = document.querySelector('span.api-info-version') || document.querySelector('div.api-info span');
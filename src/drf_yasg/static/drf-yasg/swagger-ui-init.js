@@ -123,10 +123,12 @@ function initSwaggerUiConfig(swaggerSettings, oauth2Settings) {
     var refetchWithAuth = swaggerSettings.refetchWithAuth;
     var refetchOnLogout = swaggerSettings.refetchOnLogout;
     var fetchSchemaWithQuery = swaggerSettings.fetchSchemaWithQuery;
+    var lazyLoadSpec = swaggerSettings.lazyLoadSpec;
     delete swaggerSettings['persistAuth'];
     delete swaggerSettings['refetchWithAuth'];
     delete swaggerSettings['refetchOnLogout'];
     delete swaggerSettings['fetchSchemaWithQuery'];
+    delete swaggerSettings['lazyLoadSpec'];
 
     for (var p in swaggerSettings) {
         if (swaggerSettings.hasOwnProperty(p)) {
@@ -153,6 +155,12 @@ function initSwaggerUiConfig(swaggerSettings, oauth2Settings) {
     if (refetchWithAuth) {
         specURL = applyAuth(savedAuth, specURL) || specURL;
     }
+    if (lazyLoadSpec) {
+        // start from the spec index; the operations of each tag are loaded by lazySpecPlugin when it is expanded
+        specURL = setQueryParam(specURL, 'index', '1');
+        swaggerUiConfig.docExpansion = 'none';
+        swaggerUiConfig.plugins = swaggerUiConfig.plugins.concat([lazySpecPlugin]);
+    }
     swaggerUiConfig.url = specURL;
 
     if (persistAuth || refetchWithAuth) {
@@ -236,6 +244,101 @@ function initSwaggerUiConfig(swaggerSettings, oauth2Settings) {
     }
 }
 
+/**
+ * SwaggerUI plugin which loads the operations of a tag, along with the definitions they reference, when the tag is
+ * expanded. Used with the spec index served when LAZY_LOAD_SPEC is enabled.
+ */
+function lazySpecPlugin() {
+    var loadedTags = {};
+
+    function loadTag(system, tag) {
+        if (loadedTags[tag]) {
+            return;
+        }
+        loadedTags[tag] = true;
+
+        var url = removeQueryParam(system.specSelectors.url(), 'index');
+        url = setQueryParam(url, 'tags', tag);
+        system.fn.fetch({
+            url: url,
+            loadSpec: true,
+            credentials: 'same-origin',
+            headers: {'Accept': 'application/json'},
+            requestInterceptor: system.getConfigs().requestInterceptor
+        }).then(function (response) {
+            var fragment = response.body || JSON.parse(response.text);
+            var spec = system.specSelectors.specJson().toJS();
+            system.specActions.updateJsonSpec(mergeSpecFragment(spec, fragment));
+        }).catch(function (error) {
+            delete loadedTags[tag];
+            console.log("WARNING: failed to load operations of tag " + tag, error);
+        });
+    }
+
+    function loadShownTags(system) {
+        system.specSelectors.taggedOperations().keySeq().forEach(function (tag) {
+            if (system.layoutSelectors.isShown(['operations-tag', tag], false)) {
+                loadTag(system, tag);
+            }
+        });
+    }
+
+    return {
+        statePlugins: {
+            layout: {
+                wrapActions: {
+                    show: function (oriAction, system) {
+                        return function (thing, shown) {
+                            var key = thing && thing.toJS ? thing.toJS() : [].concat(thing);
+                            if (shown && key[0] === 'operations-tag') {
+                                loadTag(system, key[1]);
+                            }
+                            return oriAction(thing, shown);
+                        };
+                    }
+                }
+            },
+            spec: {
+                wrapActions: {
+                    updateLoadingStatus: function (oriAction, system) {
+                        return function (status) {
+                            var result = oriAction(status);
+                            if (status === 'success') {
+                                // a new index was downloaded, e.g. after logging in; reload any open tags from it
+                                loadedTags = {};
+                                setTimeout(function () {
+                                    loadShownTags(system);
+                                });
+                            }
+                            return result;
+                        };
+                    }
+                }
+            }
+        }
+    };
+}
+
+/**
+ * Merge the operations and definitions of a spec fragment into a spec.
+ * @param {object} spec the spec to update, modified in place
+ * @param {object} fragment a spec holding some of the operations of spec
+ * @return object the updated spec
+ */
+function mergeSpecFragment(spec, fragment) {
+    var paths = fragment.paths || {};
+    spec.paths = spec.paths || {};
+    for (var path in paths) {
+        if (paths.hasOwnProperty(path)) {
+            spec.paths[path] = Object.assign(spec.paths[path] || {}, paths[path]);
+        }
+    }
+    if (fragment.definitions) {
+        spec.definitions = Object.assign(spec.definitions || {}, fragment.definitions);
+    }
+    return spec;
+}
+
 function _usp(url, fn) {
     url = url.split('?');
     var usp = new URLSearchParams(url[1] || '');
@@ -551,8 +551,8 @@ def get_serializer_ref_name(serializer):
         serializer, serializers.ModelSerializer
     ):
         logger.debug(
-            "Forcing inline output for ModelSerializer named 'NestedSerializer':\n"
-            + str(serializer)
+            "Forcing inline output for ModelSerializer named 'NestedSerializer':\n%s",
+            serializer,
         )
         ref_name = None
     else:
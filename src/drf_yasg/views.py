@@ -1,7 +1,16 @@
+import time
 import warnings
 from functools import WRAPPER_ASSIGNMENTS, wraps
 
-from django.utils.cache import add_never_cache_headers
+from django.urls import get_script_prefix
+from django.utils import translation
+from django.utils.cache import (
+    add_never_cache_headers,
+    get_conditional_response,
+    patch_cache_control,
+    patch_response_headers,
+)
+from django.utils.http import http_date
 from django.views.decorators.cache import cache_page
 from django.views.decorators.vary import vary_on_headers
 from rest_framework import exceptions
@@ -10,6 +19,13 @@ from rest_framework.settings import api_settings
 from rest_framework.views import APIView
 
 from .app_settings import swagger_settings
+from .caching import (
+    load_static_spec,
+    run_in_schema_executor,
+    schema_cache,
+    shared_schema_cache,
+)
+from .generators import EndpointFilter
 from .renderers import (
     ReDocOldRenderer,
     ReDocRenderer,
@@ -31,6 +47,9 @@ def deferred_never_cache(view_func):
     """
     Decorator that adds headers to a response so that it will
     never be cached.
+
+    Responses which carry an ``ETag`` may still be stored by the client, but must be
+    revalidated on every use.
     """
 
     @wraps(view_func, assigned=WRAPPER_ASSIGNMENTS)
@@ -42,7 +61,13 @@ def deferred_never_cache(view_func):
         # this, cache_page will give up because it will see and obey the "never
         # cache" headers
         def callback(response):
-            add_never_cache_headers(response)
+            if response.has_header("ETag"):
+                patch_response_headers(response, cache_timeout=0)
+                patch_cache_control(
+                    response, no_cache=True, must_revalidate=True, private=True
+                )
+            else:
+                add_never_cache_headers(response)
             return response
 
         response.add_post_render_callback(callback)
@@ -51,6 +76,479 @@ def deferred_never_cache(view_func):
     return _wrapped_view_func
 
 
+def _render_view(view_func, request, *args, **kwargs):
+    response = view_func(request, *args, **kwargs)
+    if hasattr(response, "render") and callable(response.render):
+        response.render()
+    return response
+
+
+def async_schema_view(view_func):
+    """
+    Decorator that turns a schema view into an async view for ASGI deployments.
+
+    The view is called and its response is rendered in the
+    :func:`~.caching.get_schema_executor` thread pool, so that neither generating nor
+    encoding the schema blocks the event loop. Schemas served from the caches are
+    awaited the same way. If the client disconnects, the request is abandoned
+    immediately; a generation already in progress is completed in the background
+    and cached.
+
+    Usage: ``async_schema_view(schema_view.with_ui("swagger", cache_timeout=0))``
+    """
+
+    @wraps(view_func)
+    async def _wrapped_view_func(request, *args, **kwargs):
+        return await run_in_schema_executor(
+            _render_view, view_func, request, *args, **kwargs
+        )
+
+    return _wrapped_view_func
+
+
+class SchemaView(APIView):
+    """Base class of the schema views created by :func:`.get_schema_view`, which
+    sets the class attributes below."""
+
+    _ignore_model_permissions = True
+    schema = None  # exclude from schema
+    #: information about the API
+    info = None
+    #: same as :class:`.OpenAPISchemaGenerator`
+    url = None
+    #: same as :class:`.OpenAPISchemaGenerator`
+    patterns = None
+    #: same as :class:`.OpenAPISchemaGenerator`
+    urlconf = None
+    #: if False, includes only the endpoints that are accessible by the user
+    public = False
+    generator_class = None
+    #: spec renderers, without the web UI ones
+    spec_renderer_classes = SPEC_RENDERERS
+    renderer_classes = SPEC_RENDERERS
+    #: path to a prebuilt spec file served instead of generating the schema
+    static_spec_path = None
+
+    def get(self, request, version="", format=None):
+        version = request.version or version or ""
+        cache_key = None
+        if self.static_spec_path:
+            schema = self.get_static_schema(version)
+        else:
+            cache_key = self.get_cache_key(request, version)
+            if cache_key is None:
+                schema = self.generate_schema(request, version)
+            else:
+                schema = self.get_cached_schema(request, version, cache_key)
+                if schema is None:
+                    with schema_cache.lock(cache_key):
+                        # another thread might have generated it while this one waited
+                        schema = self.get_cached_schema(request, version, cache_key)
+                        if schema is None:
+                            schema = self.generate_shared_schema(
+                                request, version, cache_key
+                            )
+
+        if self.is_index_request(request):
+            schema = self.get_schema_index(request, version, schema, cache_key)
+        return self.get_schema_response(request, schema)
+
+    def is_index_request(self, request):
+        """Check if `request` asks for the spec index loaded first by the web UIs in
+        lazy mode, by passing the ``index`` query parameter.
+
+        :param request: the request made against the schema view
+        :rtype: bool
+        """
+        return (
+            isinstance(request.accepted_renderer, _SpecRenderer)
+            and "index" in request.query_params
+        )
+
+    def get_schema_index(self, request, version, schema, cache_key=None):
+        """Get the index of `schema`, as built by
+        :meth:`~.OpenAPISchemaGenerator.get_schema_index`. If `schema` is cached, its
+        index is cached alongside it.
+
+        :param request: the request made against the schema view
+        :param str version: the API version requested
+        :param openapi.Swagger schema: the full schema
+        :param tuple cache_key: key returned by :meth:`.get_cache_key`, if any
+        :rtype: openapi.Swagger
+        """
+        last_modified = getattr(schema, "_last_modified", None)
+        index_key = None
+        if cache_key is not None:
+            index_key = cache_key + ("index",)
+            index = schema_cache.get(index_key)
+            if index is not None and index._last_modified == last_modified:
+                return index
+
+        index = self.get_generator(request, version).get_schema_index(schema)
+        index._last_modified = last_modified
+        if index_key is not None:
+            schema_cache.set(index_key, index)
+        return index
+
+    def get_static_schema(self, version):
+        """Load the prebuilt spec file given by :attr:`.static_spec_path` for the
+        requested version. The path can contain a ``{version}`` placeholder, which is
+        replaced by the requested API version, or by the default version of
+        :attr:`.info` if none was requested.
+
+        :param str version: the API version requested
+        :rtype: openapi.Swagger
+        """
+        version = version or self.info._default_version
+        try:
+            return load_static_spec(self.static_spec_path.format(version=version))
+        except FileNotFoundError:
+            raise exceptions.NotFound()
+
+    def generate_schema(self, request, version, public=None):
+        """Generate the schema for `request`, stamped with its generation time.
+
+        If :ref:`PRIVATE_SCHEMA_CACHE <schema-cache-settings>` is ``'prune'``, private
+        schemas are pruned from the cached public schema instead of being generated
+        (see :meth:`.get_public_schema`).
+
+        :param request: the request made against the schema view
+        :param str version: the API version requested
+        :param bool public: overrides :attr:`.public` if given
+        :rtype: openapi.Swagger
+        """
+        public = self.public if public is None else public
+        generator = self.get_generator(request, version)
+        if not public and swagger_settings.PRIVATE_SCHEMA_CACHE == "prune":
+            full_schema = self.get_public_schema(request, version)
+            schema = generator.prune_schema(full_schema, request, public)
+            schema._last_modified = full_schema._last_modified
+            return schema
+
+        schema = generator.get_schema(request, public)
+        if schema is None:
+            raise exceptions.PermissionDenied()  # pragma: no cover
+        schema._last_modified = int(time.time())
+        return schema
+
+    def generate_shared_schema(self, request, version, cache_key, stale_schema=None):
+        """Generate the schema for `request` and store it in the schema caches.
+
+        If both :ref:`SCHEMA_CACHE_ALIAS <schema-cache-settings>` and
+        :ref:`SCHEMA_CACHE_LOCK_TIMEOUT <schema-cache-settings>` are set, a lock
+        is first taken in the shared cache, so that only one process generates the
+        schema while the others wait for it to be stored.
+
+        When refreshing a `stale_schema`, a newer schema already stored in the shared
+        cache by another process is used instead of generating one, and if another
+        process holds the lock, `stale_schema` is returned right away so that it keeps
+        being served until that process is done.
+
+        :param request: the request made against the schema view
+        :param str version: the API version requested
+        :param tuple cache_key: key returned by :meth:`.get_cache_key`
+        :param openapi.Swagger stale_schema: the cached schema being refreshed, if any
+        :rtype: openapi.Swagger
+        """
+        lock_timeout = swagger_settings.SCHEMA_CACHE_LOCK_TIMEOUT
+        if not (lock_timeout and shared_schema_cache.enabled):
+            schema = self.generate_schema(request, version)
+            self.store_schema(cache_key, schema)
+            return schema
+
+        shared_key = self.get_shared_cache_key(cache_key)
+        if stale_schema is not None:
+            schema = shared_schema_cache.get(shared_key)
+            if schema is not None:
+                if schema._last_modified > stale_schema._last_modified:
+                    return schema
+
+        with shared_schema_cache.lock(shared_key, lock_timeout) as acquired:
+            if not acquired:
+                if stale_schema is not None:
+                    return stale_schema
+                schema = shared_schema_cache.wait(shared_key, lock_timeout)
+                if schema is not None:
+                    schema_cache.set(cache_key, schema)
+                    return schema
+
+            schema = self.generate_schema(request, version)
+            self.store_schema(cache_key, schema)
+            return schema
+
+    def get_public_schema(self, request, version):
+        """Get the schema generated with ``public=True`` that private schemas are
+        pruned from, generating it if it is not cached or older than
+        :ref:`SCHEMA_CACHE_TIMEOUT <schema-cache-settings>`.
+
+        :param request: the request made against the schema view
+        :param str version: the API version requested
+        :rtype: openapi.Swagger
+        """
+        cache_key = self.get_cache_key(request, version, public=True)
+        if cache_key is None:
+            return self.generate_schema(request, version, public=True)
+
+        def get_fresh_schema():
+            schema = schema_cache.get(cache_key)
+            timeout = swagger_settings.SCHEMA_CACHE_TIMEOUT
+            if schema is not None and timeout is not None:
+                if time.time() - schema._last_modified >= timeout:
+                    return None
+            return schema
+
+        schema = get_fresh_schema()
+        if schema is None:
+            with schema_cache.lock(cache_key):
+                schema = get_fresh_schema()
+                if schema is None:
+                    schema = self.generate_schema(request, version, public=True)
+                    schema_cache.set(cache_key, schema)
+        return schema
+
+    def get_cached_schema(self, request, version, cache_key):
+        """Look up the schema stored under `cache_key`, taking
+        :ref:`SCHEMA_CACHE_TIMEOUT <schema-cache-settings>` into account.
+
+        A schema older than the timeout is still returned while it is within
+        :ref:`SCHEMA_CACHE_MAX_STALENESS <schema-cache-settings>` of it, and a
+        background regeneration is started to replace it; past that bound, ``None``
+        is returned so that the schema is regenerated synchronously.
+
+        :param request: the request made against the schema view
+        :param str version: the API version requested
+        :param tuple cache_key: key returned by :meth:`.get_cache_key`
+        :rtype: openapi.Swagger or None
+        """
+        schema = schema_cache.get(cache_key)
+        if schema is None and shared_schema_cache.enabled:
+            shared_key = self.get_shared_cache_key(cache_key)
+            schema = shared_schema_cache.get(shared_key)
+            if schema is not None:
+                schema_cache.set(cache_key, schema)
+
+        timeout = swagger_settings.SCHEMA_CACHE_TIMEOUT
+        if schema is None or timeout is None:
+            return schema
+
+        age = time.time() - schema._last_modified
+        if age < timeout:
+            return schema
+        if age >= timeout + (swagger_settings.SCHEMA_CACHE_MAX_STALENESS or 0):
+            return None
+
+        def regenerate():
+            return self.generate_shared_schema(
+                request, version, cache_key, stale_schema=schema
+            )
+
+        schema_cache.refresh(cache_key, regenerate)
+        return schema
+
+    def store_schema(self, cache_key, schema):
+        """Store a newly generated schema in the in-process
+        :data:`~.caching.schema_cache`, and in the
+        :data:`~.caching.shared_schema_cache` if
+        :ref:`SCHEMA_CACHE_ALIAS <schema-cache-settings>` is set.
+
+        :param tuple cache_key: key returned by :meth:`.get_cache_key`
+        :param openapi.Swagger schema: the schema to store
+        """
+        schema_cache.set(cache_key, schema)
+        if shared_schema_cache.enabled:
+            shared_key = self.get_shared_cache_key(cache_key)
+            shared_schema_cache.set(shared_key, schema)
+
+    def get_shared_cache_key(self, cache_key):
+        """Return the key under which the schema is kept in the
+        :data:`~.caching.shared_schema_cache`. Unlike `cache_key`, this is the same
+        in all processes; the API info is added to tell apart schema views that are
+        otherwise configured the same.
+
+        :param tuple cache_key: key returned by :meth:`.get_cache_key`
+        :rtype: str
+        """
+        return shared_schema_cache.make_key(cache_key, self.info.as_dict())
+
+    def get_schema_response(self, request, schema):
+        """Build the response for `schema`.
+
+        When rendering with a spec renderer, the response gets an ``ETag`` computed
+        from the encoded spec and a ``Last-Modified`` header set to the schema's
+        generation time, and conditional requests (``If-None-Match``,
+        ``If-Modified-Since``) are answered with ``304 Not Modified``.
+
+        :param request: the request made against the schema view
+        :param openapi.Swagger schema: the schema to respond with
+        :rtype: Response
+        """
+        renderer = request.accepted_renderer
+        if not isinstance(renderer, _SpecRenderer):
+            return Response(schema)
+
+        content_encoding = renderer.get_content_encoding(request)
+        headers = {"ETag": renderer.get_etag(schema, content_encoding)}
+        if swagger_settings.PRECOMPRESS_SPEC:
+            headers["Vary"] = "Accept-Encoding"
+        last_modified = getattr(schema, "_last_modified", None)
+        if last_modified is not None:
+            headers["Last-Modified"] = http_date(last_modified)
+
+        conditional = get_conditional_response(
+            request, etag=headers["ETag"], last_modified=last_modified
+        )
+        if conditional is not None:
+            response = Response(status=conditional.status_code, headers=headers)
+            # keep cache_page from storing and replaying conditional responses
+            patch_cache_control(response, private=True)
+            return response
+
+        return Response(schema, headers=headers)
+
+    def get_generator(self, request, version):
+        """Instantiate the schema generator for the given request.
+
+        :param request: the request made against the schema view
+        :param str version: the API version requested
+        :rtype: drf_yasg.generators.OpenAPISchemaGenerator
+        """
+        if isinstance(request.accepted_renderer, _SpecRenderer):
+            generator = self.generator_class(
+                self.info, version, self.url, self.patterns, self.urlconf
+            )
+            endpoint_filter = self.get_endpoint_filter(request)
+            if endpoint_filter is not None:
+                generator.endpoint_filter = endpoint_filter
+            return generator
+        return self.generator_class(self.info, version, self.url, patterns=[])
+
+    def get_endpoint_filter(self, request):
+        """Get the filter selecting the endpoints included in the spec, built from the
+        query parameters of `request` (see :meth:`.EndpointFilter.from_query_params`).
+
+        :param request: the request made against the schema view
+        :rtype: drf_yasg.generators.EndpointFilter or None
+        """
+        return EndpointFilter.from_query_params(request.query_params)
+
+    def get_cache_key(self, request, version, public=None):
+        """Return the key under which the schema generated for `request` is kept in
+        the in-process :data:`~.caching.schema_cache`, or ``None`` if the schema
+        must not be cached.
+
+        Private schemas depend on the permissions of the requesting user, so they
+        are only cached if :ref:`PRIVATE_SCHEMA_CACHE <schema-cache-settings>` is
+        set; they are then keyed by a fingerprint of the endpoints visible to the
+        user (see :meth:`~.OpenAPISchemaGenerator.get_permission_fingerprint`), so
+        that all users with the same effective permissions share one cached schema.
+
+        :param request: the request made against the schema view
+        :param str version: the API version requested
+        :param bool public: overrides :attr:`.public` if given
+        :rtype: tuple or None
+        """
+        # the shared cache is only a second level behind the in-process cache, which
+        # keeps the decoded schema along with its encodings
+        if schema_cache.maxsize <= 0:
+            return None
+
+        public = self.public if public is None else public
+        fingerprint = None
+        if not public:
+            if swagger_settings.PRIVATE_SCHEMA_CACHE not in ("fingerprint", "prune"):
+                return None
+            generator = self.get_generator(request, version)
+            fingerprint = generator.get_permission_fingerprint(request, public)
+
+        is_spec = isinstance(request.accepted_renderer, _SpecRenderer)
+        base_url = self.url
+        if base_url is None:
+            base_url = swagger_settings.DEFAULT_API_URL
+        if base_url is None:
+            # host and scheme are inferred from the request
+            base_url = request.build_absolute_uri("/")
+
+        return (
+            type(self),
+            self.generator_class,
+            version,
+            public,
+            is_spec,
+            self.urlconf,
+            tuple(self.patterns) if self.patterns is not None else None,
+            base_url,
+            get_script_prefix(),
+            # some strings are translated while generating the schema
+            translation.get_language(),
+            self.get_endpoint_filter(request) if is_spec else None,
+            fingerprint,
+        )
+
+    @classmethod
+    def apply_cache(cls, view, cache_timeout, cache_kwargs):
+        """Override this method to customize how caching is applied to the view.
+
+        Arguments described in :meth:`.as_cached_view`.
+        """
+        view = vary_on_headers("Cookie", "Authorization")(view)
+        view = cache_page(cache_timeout, **cache_kwargs)(view)
+        view = deferred_never_cache(view)  # disable in-browser caching
+        return view
+
+    @classmethod
+    def as_cached_view(cls, cache_timeout=0, cache_kwargs=None, **initkwargs):
+        """
+        Calls .as_view() and wraps the result in a cache_page decorator.
+        See https://docs.djangoproject.com/en/dev/topics/cache/
+
+        :param int cache_timeout: same as cache_page; set to 0 for no cache
+        :param dict cache_kwargs: dictionary of kwargs to be passed to cache_page
+        :param initkwargs: kwargs for .as_view()
+        :return: a view instance
+        """
+        cache_kwargs = cache_kwargs or {}
+        view = cls.as_view(**initkwargs)
+        if cache_timeout != 0:
+            view = cls.apply_cache(view, cache_timeout, cache_kwargs)
+        elif cache_kwargs:
+            warnings.warn("cache_kwargs ignored because cache_timeout is 0 (disabled)")
+        return view
+
+    @classmethod
+    def without_ui(cls, cache_timeout=0, cache_kwargs=None):
+        """
+        Instantiate this view with just JSON and YAML renderers, optionally wrapped
+        with cache_page.  See https://docs.djangoproject.com/en/dev/topics/cache/.
+
+        :param int cache_timeout: same as cache_page; set to 0 for no cache
+        :param dict cache_kwargs: dictionary of kwargs to be passed to cache_page
+        :return: a view instance
+        """
+        return cls.as_cached_view(
+            cache_timeout, cache_kwargs, renderer_classes=cls.spec_renderer_classes
+        )
+
+    @classmethod
+    def with_ui(cls, renderer="swagger", cache_timeout=0, cache_kwargs=None):
+        """
+        Instantiate this view with a Web UI renderer, optionally wrapped with
+        cache_page.  See https://docs.djangoproject.com/en/dev/topics/cache/.
+
+        :param str renderer: UI renderer; allowed values are ``swagger``, ``redoc``
+        :param int cache_timeout: same as cache_page; set to 0 for no cache
+        :param dict cache_kwargs: dictionary of kwargs to be passed to cache_page
+        :return: a view instance
+        """
+        assert renderer in UI_RENDERERS, "supported default renderers are " + ", ".join(
+            UI_RENDERERS
+        )
+        renderer_classes = UI_RENDERERS[renderer] + cls.spec_renderer_classes
+
+        return cls.as_cached_view(
+            cache_timeout, cache_kwargs, renderer_classes=renderer_classes
+        )
+
+
 def get_schema_view(
     info=None,
     url=None,
@@ -61,6 +559,7 @@ def get_schema_view(
     generator_class=None,
     authentication_classes=None,
     permission_classes=None,
+    static_spec_path=None,
 ):
     """Create a SchemaView class with default renderers and generators.
 
@@ -78,17 +577,20 @@ def get_schema_view(
     :param list authentication_classes: authentication classes for the schema view
         itself
     :param list permission_classes: permission classes for the schema view itself
+    :param str static_spec_path: path to a prebuilt JSON or YAML spec file to serve
+        instead of generating the schema, see :meth:`.SchemaView.get_static_schema`;
+        the same spec is served to all users, so this requires ``public=True``
     :return: SchemaView class
     :rtype: type[drf_yasg.views.SchemaView]
     """
-    _public = public
-    _generator_class = generator_class or swagger_settings.DEFAULT_GENERATOR_CLASS
-    _auth_classes = authentication_classes
-    if _auth_classes is None:
-        _auth_classes = api_settings.DEFAULT_AUTHENTICATION_CLASSES
-    _perm_classes = permission_classes
-    if _perm_classes is None:
-        _perm_classes = api_settings.DEFAULT_PERMISSION_CLASSES
+    assert public or not static_spec_path, (
+        "static_spec_path serves the same spec to all users and requires public=True"
+    )
+    generator_class = generator_class or swagger_settings.DEFAULT_GENERATOR_CLASS
+    if authentication_classes is None:
+        authentication_classes = api_settings.DEFAULT_AUTHENTICATION_CLASSES
+    if permission_classes is None:
+        permission_classes = api_settings.DEFAULT_PERMISSION_CLASSES
     info = info or swagger_settings.DEFAULT_INFO
     validators = validators or []
     _spec_renderers = tuple(
@@ -110,91 +612,20 @@ def get_schema_view(
             if issubclass(cls, (SwaggerJSONRenderer, SwaggerYAMLRenderer))
         )
 
-    class SchemaView(APIView):
-        _ignore_model_permissions = True
-        schema = None  # exclude from schema
-        public = _public
-        generator_class = _generator_class
-        authentication_classes = _auth_classes
-        permission_classes = _perm_classes
-        renderer_classes = _spec_renderers
-
-        def get(self, request, version="", format=None):
-            version = request.version or version or ""
-            if isinstance(request.accepted_renderer, _SpecRenderer):
-                generator = self.generator_class(info, version, url, patterns, urlconf)
-            else:
-                generator = self.generator_class(info, version, url, patterns=[])
-
-            schema = generator.get_schema(request, self.public)
-            if schema is None:
-                raise exceptions.PermissionDenied()  # pragma: no cover
-            return Response(schema)
-
-        @classmethod
-        def apply_cache(cls, view, cache_timeout, cache_kwargs):
-            """Override this method to customize how caching is applied to the view.
-
-            Arguments described in :meth:`.as_cached_view`.
-            """
-            view = vary_on_headers("Cookie", "Authorization")(view)
-            view = cache_page(cache_timeout, **cache_kwargs)(view)
-            view = deferred_never_cache(view)  # disable in-browser caching
-            return view
-
-        @classmethod
-        def as_cached_view(cls, cache_timeout=0, cache_kwargs=None, **initkwargs):
-            """
-            Calls .as_view() and wraps the result in a cache_page decorator.
-            See https://docs.djangoproject.com/en/dev/topics/cache/
-
-            :param int cache_timeout: same as cache_page; set to 0 for no cache
-            :param dict cache_kwargs: dictionary of kwargs to be passed to cache_page
-            :param initkwargs: kwargs for .as_view()
-            :return: a view instance
-            """
-            cache_kwargs = cache_kwargs or {}
-            view = cls.as_view(**initkwargs)
-            if cache_timeout != 0:
-                view = cls.apply_cache(view, cache_timeout, cache_kwargs)
-            elif cache_kwargs:
-                warnings.warn(
-                    "cache_kwargs ignored because cache_timeout is 0 (disabled)"
-                )
-            return view
-
-        @classmethod
-        def without_ui(cls, cache_timeout=0, cache_kwargs=None):
-            """
-            Instantiate this view with just JSON and YAML renderers, optionally wrapped
-            with cache_page.  See https://docs.djangoproject.com/en/dev/topics/cache/.
-
-            :param int cache_timeout: same as cache_page; set to 0 for no cache
-            :param dict cache_kwargs: dictionary of kwargs to be passed to cache_page
-            :return: a view instance
-            """
-            return cls.as_cached_view(
-                cache_timeout, cache_kwargs, renderer_classes=_spec_renderers
-            )
-
-        @classmethod
-        def with_ui(cls, renderer="swagger", cache_timeout=0, cache_kwargs=None):
-            """
-            Instantiate this view with a Web UI renderer, optionally wrapped with
-            cache_page.  See https://docs.djangoproject.com/en/dev/topics/cache/.
-
-            :param str renderer: UI renderer; allowed values are ``swagger``, ``redoc``
-            :param int cache_timeout: same as cache_page; set to 0 for no cache
-            :param dict cache_kwargs: dictionary of kwargs to be passed to cache_page
-            :return: a view instance
-            """
-            assert renderer in UI_RENDERERS, (
-                "supported default renderers are " + ", ".join(UI_RENDERERS)
-            )
-            renderer_classes = UI_RENDERERS[renderer] + _spec_renderers
-
-            return cls.as_cached_view(
-                cache_timeout, cache_kwargs, renderer_classes=renderer_classes
-            )
-
-    return SchemaView
+    return type(
+        "SchemaView",
+        (SchemaView,),
+        {
+            "info": info,
+            "url": url,
+            "patterns": patterns,
+            "urlconf": urlconf,
+            "public": public,
+            "generator_class": generator_class,
+            "authentication_classes": authentication_classes,
+            "permission_classes": permission_classes,
+            "spec_renderer_classes": _spec_renderers,
+            "renderer_classes": _spec_renderers,
+            "static_spec_path": static_spec_path,
+        },
+    )
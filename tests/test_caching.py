@@ -0,0 +1,512 @@
+import asyncio
+import json
+import pickle
+import threading
+import time
+from contextlib import contextmanager
+
+import pytest
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.test import Client, RequestFactory
+from django.urls import clear_url_caches, set_script_prefix
+from django.utils import translation
+from django.utils.translation import gettext_lazy
+from rest_framework.permissions import AllowAny
+
+from drf_yasg import openapi
+from drf_yasg.caching import (
+    SchemaCache,
+    SharedSchemaCache,
+    load_static_spec,
+    schema_cache,
+    shared_schema_cache,
+    warm_up_schema_cache,
+)
+from drf_yasg.codecs import OpenAPICodecJson
+from drf_yasg.generators import OpenAPISchemaGenerator
+from drf_yasg.renderers import OpenAPIRenderer, SwaggerJSONRenderer
+from drf_yasg.views import async_schema_view, get_schema_view
+
+
+@pytest.fixture
+def count_generations(monkeypatch):
+    calls = []
+    get_schema = OpenAPISchemaGenerator.get_schema
+
+    def counting_get_schema(self, request=None, public=False):
+        calls.append(public)
+        return get_schema(self, request, public)
+
+    monkeypatch.setattr(OpenAPISchemaGenerator, "get_schema", counting_get_schema)
+    return calls
+
+
+@pytest.fixture
+def enable_schema_cache(swagger_settings):
+    swagger_settings["SCHEMA_CACHE_SIZE"] = 8
+    # views are also wrapped with cache_page, which might hold responses from
+    # earlier tests
+    cache.clear()
+    yield
+    schema_cache.clear()
+
+
+def test_lru_eviction():
+    cache = SchemaCache(maxsize=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1
+    cache.set("c", 3)
+
+    assert "a" in cache
+    assert "b" not in cache
+    assert cache.get("c") == 3
+    assert len(cache) == 2
+
+
+def test_disabled_cache():
+    cache = SchemaCache(maxsize=0)
+    cache.set("a", 1)
+    assert cache.get("a") is None
+
+
+def test_cleared_on_urlconf_reload():
+    cache = SchemaCache(maxsize=2)
+    cache.set("a", 1)
+    clear_url_caches()
+    assert cache.get("a") is None
+
+
+def test_cleared_on_setting_changed(settings):
+    schema_cache._maxsize = 2
+    try:
+        schema_cache.set("a", 1)
+        settings.SWAGGER_SETTINGS = {**settings.SWAGGER_SETTINGS}
+        assert schema_cache.get("a") is None
+    finally:
+        schema_cache._maxsize = None
+        schema_cache.clear()
+
+
+def test_schema_view_cache(client, enable_schema_cache, count_generations):
+    first = client.get("/swagger.json")
+    second = client.get("/swagger.json")
+    assert first.status_code == second.status_code == 200
+    assert json.loads(first.content) == json.loads(second.content)
+    assert len(count_generations) == 1
+
+    client.get("/swagger.json", HTTP_HOST="other.test")
+    assert len(count_generations) == 2
+
+    with translation.override("de"):
+        client.get("/swagger.json")
+    assert len(count_generations) == 3
+
+
+@pytest.mark.urls("urlconfs.non_public_urls")
+def test_private_schema_not_cached(client, enable_schema_cache, count_generations):
+    client.get("/private/swagger.yaml")
+    # the private view is also wrapped with cache_page
+    cache.clear()
+    client.get("/private/swagger.yaml")
+    assert count_generations == [False, False]
+
+
+@pytest.mark.urls("urlconfs.non_public_urls")
+def test_private_schema_fingerprint_cache(
+    client, db, swagger_settings, enable_schema_cache, count_generations
+):
+    swagger_settings["PRIVATE_SCHEMA_CACHE"] = "fingerprint"
+
+    anonymous = client.get("/private/swagger.yaml")
+    cache.clear()
+    client.cookies["sessionid"] = "anonymous-session"
+    assert client.get("/private/swagger.yaml").content == anonymous.content
+    assert len(count_generations) == 1
+
+    cache.clear()
+    client.force_login(User.objects.get(username="admin"))
+    admin = client.get("/private/swagger.yaml")
+    assert len(count_generations) == 2
+    assert anonymous.content != admin.content
+
+
+@pytest.mark.urls("urlconfs.non_public_urls")
+def test_private_schema_prune_cache(
+    client, db, swagger_settings, enable_schema_cache, count_generations
+):
+    admin_user = User.objects.get(username="admin")
+    generated = {}
+    for user in (None, admin_user):
+        if user is not None:
+            client.force_login(user)
+        generated[user] = client.get("/private/swagger.yaml").content
+        client.logout()
+    assert count_generations == [False, False]
+    assert generated[None] != generated[admin_user]
+
+    count_generations.clear()
+    swagger_settings["PRIVATE_SCHEMA_CACHE"] = "prune"
+    assert client.get("/private/swagger.yaml").content == generated[None]
+    client.force_login(admin_user)
+    assert client.get("/private/swagger.yaml").content == generated[admin_user]
+    assert count_generations == [True]
+
+
+def test_referenced_definitions():
+    definitions = {
+        "Article": {"properties": {"author": {"$ref": "#/definitions/User"}}},
+        "User": {"properties": {"groups": {"items": {"$ref": "#/definitions/Group"}}}},
+        "Group": {"type": "object"},
+        "Unused": {"properties": {"user": {"$ref": "#/definitions/User"}}},
+    }
+    paths = {"/articles/": {"get": {"schema": {"$ref": "#/definitions/Article"}}}}
+    referenced = openapi.get_referenced_definitions(paths, definitions)
+    assert referenced == {"Article", "User", "Group"}
+
+
+def test_filtered_schema_cache(client, enable_schema_cache, count_generations):
+    articles = client.get("/swagger.json?tags=articles").content
+    todo = client.get("/swagger.json?tags=todo").content
+    assert articles != todo
+    assert client.get("/swagger.json?tags=articles").content == articles
+    assert len(count_generations) == 2
+
+
+def test_schema_index_cache(client, enable_schema_cache, count_generations):
+    full = client.get("/swagger.json").content
+    index = client.get("/swagger.json?index").content
+    assert len(index) < len(full)
+    cache.clear()
+    assert client.get("/swagger.json?index").content == index
+    assert len(count_generations) == 1
+
+
+def test_encoded_schema_cache(swagger, monkeypatch):
+    encode_calls = []
+    encode = OpenAPICodecJson.encode
+
+    def counting_encode(self, document):
+        encode_calls.append(self)
+        return encode(self, document)
+
+    monkeypatch.setattr(OpenAPICodecJson, "encode", counting_encode)
+
+    renderer = SwaggerJSONRenderer()
+    first = renderer.render(swagger)
+    assert renderer.render(swagger) is first
+    assert OpenAPIRenderer().render(swagger) is first
+    assert len(encode_calls) == 1
+
+    SwaggerJSONRenderer.with_validators(["ssv"])().render(swagger)
+    assert len(encode_calls) == 2
+
+    assert pickle.loads(pickle.dumps(swagger)) == swagger
+
+
+def test_encoded_schema_cache_language(swagger):
+    swagger.info.description = gettext_lazy("Yes")
+    renderer = SwaggerJSONRenderer()
+    with translation.override("en"):
+        assert json.loads(renderer.render(swagger))["info"]["description"] == "Yes"
+    with translation.override("de"):
+        assert json.loads(renderer.render(swagger))["info"]["description"] == "Ja"
+
+
+def test_warm_up(client, enable_schema_cache, count_generations):
+    warm_up_schema_cache(base_url="http://testserver")
+    generated = len(count_generations)
+    assert generated > 0
+
+    assert client.get("/swagger.json").status_code == 200
+    assert client.get("/swagger.yaml").status_code == 200
+    assert len(count_generations) == generated
+
+
+def test_warm_up_background(enable_schema_cache, count_generations):
+    warm_up_schema_cache(background=True).join()
+    assert len(count_generations) > 0
+
+
+def test_warm_up_disabled(count_generations):
+    warm_up_schema_cache()
+    assert count_generations == []
+
+
+def test_refresh_single_flight():
+    cache = SchemaCache(maxsize=2)
+    release = threading.Event()
+
+    def generate():
+        release.wait()
+        return 2
+
+    cache.set("a", 1)
+    thread = cache.refresh("a", generate)
+    assert cache.refresh("a", generate) is None
+    assert cache.get("a") == 1
+
+    release.set()
+    thread.join()
+    assert cache.get("a") == 2
+
+
+def _age_cached_schemas(seconds):
+    for schema in schema_cache._entries.values():
+        schema._last_modified -= seconds
+
+
+def test_stale_while_revalidate(
+    client, swagger_settings, enable_schema_cache, count_generations
+):
+    swagger_settings["SCHEMA_CACHE_TIMEOUT"] = 60
+    swagger_settings["SCHEMA_CACHE_MAX_STALENESS"] = 600
+
+    client.get("/swagger.json")
+    _age_cached_schemas(120)
+    stale = client.get("/swagger.json")
+    for thread in threading.enumerate():
+        if thread.name == "drf-yasg-refresh":
+            thread.join()
+    assert len(count_generations) == 2
+
+    fresh = client.get("/swagger.json")
+    assert len(count_generations) == 2
+    assert stale["Last-Modified"] != fresh["Last-Modified"]
+
+    _age_cached_schemas(1000)
+    client.get("/swagger.json")
+    assert len(count_generations) == 3
+
+
+def test_stale_while_revalidate_script_prefix(
+    client, swagger_settings, enable_schema_cache
+):
+    swagger_settings["SCHEMA_CACHE_TIMEOUT"] = 60
+    swagger_settings["SCHEMA_CACHE_MAX_STALENESS"] = 600
+
+    set_script_prefix("/api/")
+    try:
+        first = client.get("/swagger.json")
+        _age_cached_schemas(120)
+        stale = client.get("/swagger.json")
+        for thread in threading.enumerate():
+            if thread.name == "drf-yasg-refresh":
+                thread.join()
+        fresh = client.get("/swagger.json")
+    finally:
+        set_script_prefix("/")
+
+    assert fresh["Last-Modified"] != stale["Last-Modified"]
+    assert json.loads(first.content)["basePath"].startswith("/api")
+    assert (
+        json.loads(fresh.content)["basePath"] == json.loads(first.content)["basePath"]
+    )
+
+
+def test_static_spec(client, tmp_path, count_generations):
+    spec_path = tmp_path / "swagger-v1.json"
+    spec_path.write_bytes(client.get("/swagger.json").content)
+    del count_generations[:]
+
+    schema_view = get_schema_view(
+        public=True,
+        permission_classes=[AllowAny],
+        static_spec_path=str(tmp_path / "swagger-{version}.json"),
+    )
+    view = schema_view.with_ui("swagger")
+    request = RequestFactory().get("/swagger.json")
+
+    response = view(request, format="json").render()
+    assert response.content == spec_path.read_bytes()
+    assert "Last-Modified" in response
+    assert view(request, format="yaml").render().status_code == 200
+    assert view(request, format="swagger").render().status_code == 200
+    assert view(request, version="v2", format="json").status_code == 404
+    assert count_generations == []
+
+    assert load_static_spec(str(spec_path)) is load_static_spec(str(spec_path))
+
+    with pytest.raises(AssertionError):
+        get_schema_view(static_spec_path=str(spec_path))
+
+
+def test_shared_cache_chunks(swagger):
+    shared = SharedSchemaCache("default", chunk_size=1000)
+    key = shared.make_key("test", SchemaCache)
+    assert key == shared.make_key("test", SchemaCache)
+
+    shared.set(key, swagger)
+    digest, chunk_count = shared.cache.get(key)
+    assert chunk_count > 1
+    assert shared.get(key) == swagger
+
+    shared.cache.delete("%s:%s:%d" % (key, digest, chunk_count - 1))
+    assert shared.get(key) is None
+
+
+def test_shared_schema_view_cache(
+    client, swagger_settings, enable_schema_cache, count_generations
+):
+    swagger_settings["SCHEMA_CACHE_ALIAS"] = "default"
+    try:
+        first = client.get("/swagger.json")
+        # as if in another process
+        schema_cache.clear()
+        second = client.get("/swagger.json")
+        assert len(schema_cache) == 1
+    finally:
+        cache.clear()
+    assert first.content == second.content
+    assert len(count_generations) == 1
+
+
+def test_shared_cache_requires_local_cache(client, swagger_settings, count_generations):
+    swagger_settings["SCHEMA_CACHE_ALIAS"] = "default"
+    try:
+        client.get("/swagger.json")
+        client.get("/swagger.json")
+    finally:
+        cache.clear()
+    assert len(count_generations) == 2
+
+
+def test_single_flight(monkeypatch, enable_schema_cache, count_generations):
+    get_schema = OpenAPISchemaGenerator.get_schema
+
+    def slow_get_schema(self, request=None, public=False):
+        time.sleep(0.2)
+        return get_schema(self, request, public)
+
+    monkeypatch.setattr(OpenAPISchemaGenerator, "get_schema", slow_get_schema)
+    responses = []
+    threads = [
+        threading.Thread(target=lambda: responses.append(Client().get("/swagger.json")))
+        for _ in range(4)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert [response.status_code for response in responses] == [200] * 4
+    assert len(count_generations) == 1
+    assert len({response.content for response in responses}) == 1
+    assert schema_cache._key_locks == {}
+
+
+def test_stale_while_revalidate_shared_lock(
+    client, monkeypatch, swagger_settings, enable_schema_cache, count_generations
+):
+    swagger_settings["SCHEMA_CACHE_ALIAS"] = "default"
+    swagger_settings["SCHEMA_CACHE_LOCK_TIMEOUT"] = 5
+    swagger_settings["SCHEMA_CACHE_TIMEOUT"] = 60
+    swagger_settings["SCHEMA_CACHE_MAX_STALENESS"] = 600
+    shared_keys = []
+
+    @contextmanager
+    def locked_elsewhere(key, timeout):
+        shared_keys.append(key)
+        yield False
+
+    def refresh_stale():
+        _age_cached_schemas(120)
+        response = client.get("/swagger.json")
+        for thread in threading.enumerate():
+            if thread.name == "drf-yasg-refresh":
+                thread.join()
+        return response
+
+    try:
+        client.get("/swagger.json")
+        # the schema expired from the shared cache as well
+        cache.clear()
+        monkeypatch.setattr(shared_schema_cache, "lock", locked_elsewhere)
+
+        # another process is regenerating the schema, keep serving the stale one
+        stale = refresh_stale()
+        assert stale.status_code == 200
+        assert len(count_generations) == 1
+        assert shared_keys
+
+        # the other process is done, pick up its schema
+        (schema,) = schema_cache._entries.values()
+        newer = pickle.loads(pickle.dumps(schema))
+        newer._last_modified = int(time.time())
+        shared_schema_cache.set(shared_keys[0], newer)
+        refresh_stale()
+        fresh = client.get("/swagger.json")
+        assert fresh["Last-Modified"] != stale["Last-Modified"]
+        assert len(count_generations) == 1
+    finally:
+        cache.clear()
+
+
+def test_shared_cache_lock(swagger):
+    shared = SharedSchemaCache("default")
+    key = shared.make_key("test")
+    try:
+        with shared.lock(key, 5) as acquired:
+            assert acquired
+            with shared.lock(key, 5) as acquired_again:
+                assert not acquired_again
+
+            assert shared.wait(key, 0.2, interval=0.05) is None
+            threading.Timer(0.1, shared.set, (key, swagger)).start()
+            assert shared.wait(key, 5, interval=0.05) == swagger
+
+        with shared.lock(key, 5) as acquired:
+            assert acquired
+    finally:
+        cache.clear()
+
+
+def test_async_schema_view(enable_schema_cache, count_generations):
+    schema_view = get_schema_view(public=True, permission_classes=[AllowAny])
+    view = async_schema_view(schema_view.without_ui())
+    request = RequestFactory().get("/swagger.json")
+
+    response = asyncio.run(view(request, format="json"))
+    assert response.status_code == 200
+    assert json.loads(response.content)["swagger"] == "2.0"
+    asyncio.run(view(request, format="yaml"))
+    assert len(count_generations) == 1
+
+
+def test_async_schema_view_cancelled(
+    monkeypatch, enable_schema_cache, count_generations
+):
+    started, release, stored = threading.Event(), threading.Event(), threading.Event()
+    get_schema = OpenAPISchemaGenerator.get_schema
+    set_schema = schema_cache.set
+
+    def notifying_set(key, value):
+        set_schema(key, value)
+        stored.set()
+
+    def blocking_get_schema(self, request=None, public=False):
+        started.set()
+        release.wait()
+        return get_schema(self, request, public)
+
+    monkeypatch.setattr(OpenAPISchemaGenerator, "get_schema", blocking_get_schema)
+    monkeypatch.setattr(schema_cache, "set", notifying_set)
+    schema_view = get_schema_view(public=True, permission_classes=[AllowAny])
+    view = async_schema_view(schema_view.without_ui())
+    request = RequestFactory().get("/swagger.json")
+
+    async def cancel_request():
+        task = asyncio.ensure_future(view(request, format="json"))
+        await asyncio.get_running_loop().run_in_executor(None, started.wait, 5)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    asyncio.run(cancel_request())
+
+    # the generation that was already running still completes and is cached
+    release.set()
+    assert stored.wait(5)
+    assert len(schema_cache) == 1
+    assert len(count_generations) == 1
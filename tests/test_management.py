@@ -9,6 +9,7 @@ import pytest
 from drf_yasg import openapi
 from drf_yasg.codecs import yaml_load
 from drf_yasg.generators import OpenAPISchemaGenerator
+from drf_yasg.inspectors import SwaggerAutoSchema
 
 
 def test_reference_schema(call_generate_swagger, db, reference_schema, compare_schemas):
@@ -33,6 +34,53 @@ def test_no_mock(call_generate_swagger, db):
     assert len(output_schema["paths"]) > 0
 
 
+def test_jobs(call_generate_swagger, db):
+    serial = call_generate_swagger(format="yaml")
+    assert call_generate_swagger(format="yaml", jobs=3) == serial
+
+
+def test_cache_dir(call_generate_swagger, db, monkeypatch):
+    calls = []
+    get_operation = SwaggerAutoSchema.get_operation
+
+    def counting_get_operation(self, operation_keys=None):
+        calls.append(operation_keys)
+        return get_operation(self, operation_keys)
+
+    monkeypatch.setattr(SwaggerAutoSchema, "get_operation", counting_get_operation)
+    serial = call_generate_swagger(format="yaml")
+    generated = len(calls)
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        assert call_generate_swagger(format="yaml", cache_dir=cache_dir) == serial
+        assert len(calls) == 2 * generated
+        assert call_generate_swagger(format="yaml", cache_dir=cache_dir) == serial
+        assert len(calls) == 2 * generated
+
+
+def test_profile(call_generate_swagger, db, capsys):
+    serial = call_generate_swagger(format="yaml")
+
+    with tempfile.TemporaryDirectory() as stats_dir:
+        stats_file = os.path.join(stats_dir, "generate_swagger.prof")
+        output = call_generate_swagger(
+            format="yaml", profile_format="json", profile_stats=stats_file
+        )
+        assert os.path.getsize(stats_file) > 0
+
+    assert output == serial
+    report = json.loads(capsys.readouterr().err)
+    stages = {stage["name"]: stage for stage in report["stages"]}
+    assert stages["get_operation"]["calls"] == len(report["endpoints"])
+    for stage in ("enumeration", "create_view", "responses", "as_dict", "encoding"):
+        assert stages[stage]["seconds"] <= stages["total"]["seconds"]
+    assert any(
+        serializer["name"] == "snippets.serializers.SnippetSerializer"
+        for serializer in report["serializers"]
+    )
+    assert not hasattr(SwaggerAutoSchema.get_responses, "__wrapped__")
+
+
 class EmptySchemaGenerator(OpenAPISchemaGenerator):
     def get_paths(self, endpoints, components, request, public):
         return openapi.Paths(paths={}), ""
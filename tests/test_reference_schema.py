@@ -1,13 +1,19 @@
 import enum
 import json
 
+from rest_framework import serializers
+
 from drf_yasg import openapi
 from drf_yasg.generators import OpenAPISchemaGenerator
 from drf_yasg.inspectors import (
+    ChoiceFieldInspector,
     FieldInspector,
     FilterInspector,
+    NotHandled,
     PaginatorInspector,
     SerializerInspector,
+    SimpleFieldInspector,
+    ViewInspector,
 )
 
 
@@ -67,3 +73,119 @@ def test_no_nested_model(swagger_dict):
     # ForeignKey models in deep ModelViewSets might wrongly be labeled as 'Nested' in
     # the definitions section see https://github.com/axnsan12/drf-yasg/issues/59
     assert "Nested" not in swagger_dict["definitions"]
+
+
+def test_field_inspector_dispatch():
+    probed = []
+
+    class ChoiceOnlyInspector(FieldInspector):
+        field_classes = (serializers.ChoiceField,)
+
+        def field_to_swagger_object(self, field, *args, **kwargs):
+            probed.append(("choice", field))
+            return NotHandled
+
+        def process_result(self, result, method_name, obj, **kwargs):
+            probed.append(("process", obj))
+            return result
+
+    class UpperCaseChoiceInspector(ChoiceFieldInspector):
+        # handles more than its parent, without declaring it
+        def field_to_swagger_object(self, field, *args, **kwargs):
+            probed.append(("upper", field))
+            return NotHandled
+
+    field_inspectors = [
+        ChoiceOnlyInspector,
+        UpperCaseChoiceInspector,
+        SimpleFieldInspector,
+    ]
+    inspector = FieldInspector(None, "", "GET", None, None, field_inspectors)
+
+    char_field = serializers.CharField()
+    schema = inspector.probe_field_inspectors(char_field, openapi.Schema, True)
+    assert schema.type == openapi.TYPE_STRING
+    assert probed == [("upper", char_field)]
+
+    probed.clear()
+    choice_field = serializers.ChoiceField(choices=["a"])
+    inspector.probe_field_inspectors(choice_field, openapi.Schema, True)
+    assert probed == [
+        ("choice", choice_field),
+        ("upper", choice_field),
+        ("process", choice_field),
+    ]
+
+
+class CountingFieldInspector(FieldInspector):
+    instances = 0
+
+    def __init__(self, *args, **kwargs):
+        super(CountingFieldInspector, self).__init__(*args, **kwargs)
+        type(self).instances += 1
+
+
+class NonReusableFieldInspector(CountingFieldInspector):
+    instances = 0
+    reusable = False
+
+
+def test_inspector_reuse(monkeypatch, mock_schema_request, swagger):
+    monkeypatch.setattr(
+        ViewInspector,
+        "field_inspectors",
+        [CountingFieldInspector, NonReusableFieldInspector]
+        + ViewInspector.field_inspectors,
+    )
+
+    generator = OpenAPISchemaGenerator(
+        info=openapi.Info(title="Test generator", default_version="v1"),
+        version="v2",
+    )
+    generator.get_schema(mock_schema_request, True)
+
+    operations = sum(
+        method != "parameters"
+        for path_item in swagger["paths"].values()
+        for method in path_item
+    )
+    assert 0 < CountingFieldInspector.instances <= operations
+    assert NonReusableFieldInspector.instances > operations
+
+
+def test_field_attributes_computed_once(monkeypatch):
+    from drf_yasg.inspectors import base
+
+    calls = []
+
+    def counting(function):
+        def wrapper(value, *args, **kwargs):
+            calls.append((function.__name__, value))
+            return function(value, *args, **kwargs)
+
+        return wrapper
+
+    monkeypatch.setattr(base, "force_real_str", counting(base.force_real_str))
+    monkeypatch.setattr(base, "get_field_default", counting(base.get_field_default))
+
+    class PartialTypesInspector(FieldInspector):
+        def field_to_swagger_object(self, field, swagger_object_type, *args, **kwargs):
+            SwaggerType, _ = self._get_partial_types(field, swagger_object_type, True)
+            SwaggerType(type=openapi.TYPE_STRING)
+            return NotHandled
+
+    field_inspectors = [PartialTypesInspector] * 3 + [SimpleFieldInspector]
+    inspector = FieldInspector(None, "", "GET", None, None, field_inspectors)
+
+    field = serializers.CharField(label="Name", help_text="The name", default="x")
+    schema = inspector.probe_field_inspectors(field, openapi.Schema, True)
+    assert (schema.title, schema.description, schema.default) == (
+        "Name",
+        "The name",
+        "x",
+    )
+    assert sorted(name for name, value in calls) == [
+        "force_real_str",
+        "force_real_str",
+        "get_field_default",
+    ]
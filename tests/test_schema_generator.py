@@ -1,3 +1,4 @@
+import asyncio
 import json
 import sys
 import typing
@@ -5,7 +6,7 @@ import typing
 import pytest
 from django.contrib.postgres import fields as postgres_fields
 from django.db import models
-from django.urls import path
+from django.urls import clear_url_caches, path, set_script_prefix
 from django.utils.inspect import get_func_args
 from django_fake_model import models as fake_models
 from rest_framework import routers, serializers, viewsets
@@ -15,7 +16,8 @@ from rest_framework.response import Response
 from drf_yasg import codecs, openapi
 from drf_yasg.codecs import yaml_load
 from drf_yasg.errors import SwaggerGenerationError
-from drf_yasg.generators import OpenAPISchemaGenerator
+from drf_yasg.generators import EndpointEnumerator, OpenAPISchemaGenerator
+from drf_yasg.inspectors import CamelCaseJSONFilter, InlineSerializerInspector
 from drf_yasg.utils import swagger_auto_schema
 
 
@@ -39,6 +41,89 @@ def test_invalid_schema_fails(codec_json, mock_schema_request):
         codec_json.encode(swagger)
 
 
+def test_aget_schema(swagger, mock_schema_request):
+    generator = OpenAPISchemaGenerator(
+        info=openapi.Info(title="Test generator", default_version="v1"),
+        version="v2",
+    )
+    swagger_async = asyncio.run(generator.aget_schema(mock_schema_request, True))
+    assert swagger_async == swagger
+
+
+def test_aget_schema_script_prefix(mock_schema_request):
+    generator = OpenAPISchemaGenerator(
+        info=openapi.Info(title="Test generator", default_version="v1"),
+        version="v2",
+    )
+    set_script_prefix("/api/")
+    try:
+        swagger = asyncio.run(generator.aget_schema(mock_schema_request, True))
+    finally:
+        set_script_prefix("/")
+    assert swagger["basePath"].startswith("/api")
+
+
+@pytest.mark.parametrize("threads", [2, 3, 100])
+def test_parallel_paths(
+    swagger_settings, swagger, codec_json, mock_schema_request, threads
+):
+    swagger_settings["SCHEMA_GENERATION_THREADS"] = threads
+    generator = OpenAPISchemaGenerator(
+        info=openapi.Info(title="Test generator", default_version="v1"),
+        version="v2",
+    )
+    swagger_parallel = generator.get_schema(mock_schema_request, True)
+    assert codec_json.encode(swagger_parallel) == codec_json.encode(swagger)
+
+
+def test_endpoint_snapshot(mock_schema_request, monkeypatch):
+    enumerated = []
+    get_allowed_methods = EndpointEnumerator.get_allowed_methods
+
+    def counting_get_allowed_methods(self, callback):
+        enumerated.append(callback)
+        return get_allowed_methods(self, callback)
+
+    monkeypatch.setattr(
+        EndpointEnumerator, "get_allowed_methods", counting_get_allowed_methods
+    )
+    clear_url_caches()
+    endpoints = EndpointEnumerator(request=mock_schema_request).get_api_endpoints()
+    assert endpoints and enumerated
+
+    enumerated.clear()
+    endpoints.clear()
+    again = EndpointEnumerator(request=mock_schema_request).get_api_endpoints()
+    assert again and not enumerated
+
+    clear_url_caches()
+    assert EndpointEnumerator(request=mock_schema_request).get_api_endpoints() == again
+    assert enumerated
+
+
+def test_merge_components_conflict():
+    class FirstSerializer(serializers.Serializer):
+        pass
+
+    class SecondSerializer(serializers.Serializer):
+        pass
+
+    def make_components(serializer):
+        components = openapi.ReferenceResolver(
+            openapi.SCHEMA_DEFINITIONS, force_init=True
+        )
+        schema = openapi.Schema(type=openapi.TYPE_OBJECT)
+        schema._NP_serializer = serializer
+        components.set("Thing", schema, openapi.SCHEMA_DEFINITIONS)
+        return components
+
+    generator = OpenAPISchemaGenerator(openapi.Info("Test", "v1"))
+    components = make_components(FirstSerializer)
+    generator.merge_components(components, make_components(FirstSerializer))
+    with pytest.raises(SwaggerGenerationError):
+        generator.merge_components(components, make_components(SecondSerializer))
+
+
 def test_json_codec_roundtrip(codec_json, swagger, validate_schema):
     validate_schema(json.loads(codec_json.encode(swagger)))
 
@@ -189,6 +274,129 @@ def test_replaced_serializer():
         assert responses["404"]["schema"]["$ref"] == "#/definitions/Detail"
 
 
+def test_serializer_definition_memo(monkeypatch):
+    class DetailSerializer(serializers.Serializer):
+        detail = serializers.CharField()
+
+    class DetailViewSet(viewsets.ViewSet):
+        serializer_class = DetailSerializer
+
+        @swagger_auto_schema(responses={200: DetailSerializer, 404: DetailSerializer})
+        def retrieve(self, request, pk=None):
+            return Response({"detail": None})
+
+        @swagger_auto_schema(request_body=DetailSerializer)
+        def create(self, request):
+            return Response({"detail": None})
+
+    router = routers.DefaultRouter()
+    router.register(r"details", DetailViewSet, **_basename_or_base_name("details"))
+
+    calls = []
+    get_serializer_ref_name = InlineSerializerInspector.get_serializer_ref_name
+
+    def counting_get_serializer_ref_name(self, serializer):
+        calls.append(type(serializer))
+        return get_serializer_ref_name(self, serializer)
+
+    monkeypatch.setattr(
+        InlineSerializerInspector,
+        "get_serializer_ref_name",
+        counting_get_serializer_ref_name,
+    )
+
+    generator = OpenAPISchemaGenerator(
+        info=openapi.Info(title="Test generator", default_version="v1"),
+        patterns=router.urls,
+    )
+    for _ in range(2):
+        swagger = generator.get_schema(None, True)
+        assert "detail" in swagger["definitions"]["Detail"]["properties"]
+        responses = swagger["paths"]["/details/{id}/"]["get"]["responses"]
+        assert responses["404"]["schema"]["$ref"] == "#/definitions/Detail"
+
+    # inspected once per generation, instead of once per reference
+    assert calls == [DetailSerializer, DetailSerializer]
+
+
+def test_camel_case_memo(monkeypatch, mock_schema_request):
+    calls = []
+    camelize_string = CamelCaseJSONFilter.camelize_string
+    get_parser_classes = CamelCaseJSONFilter.get_parser_classes
+
+    def counting_camelize_string(self, s):
+        calls.append(s)
+        return camelize_string(self, s)
+
+    def counting_get_parser_classes(self):
+        calls.append(type(self.view))
+        return get_parser_classes(self)
+
+    monkeypatch.setattr(
+        CamelCaseJSONFilter, "camelize_string", counting_camelize_string
+    )
+    monkeypatch.setattr(
+        CamelCaseJSONFilter, "get_parser_classes", counting_get_parser_classes
+    )
+
+    schema = openapi.Schema(
+        type=openapi.TYPE_OBJECT,
+        properties={"first_name": openapi.Schema(type=openapi.TYPE_STRING)},
+        required=["first_name"],
+    )
+    inspector = CamelCaseJSONFilter(None, "", "GET", None, None, [])
+    inspector.camelize_schema(schema)
+    inspector.camelize_schema(schema)
+    assert list(schema.properties) == schema.required == ["firstName"]
+    assert calls == ["first_name", "first_name"]
+
+    calls.clear()
+    generator = OpenAPISchemaGenerator(
+        info=openapi.Info(title="Test generator", default_version="v1"),
+        version="v2",
+    )
+    swagger = generator.get_schema(mock_schema_request, True)
+    assert "ownerAsString" in swagger["definitions"]["Snippet"]["properties"]
+
+    # each definition is camelized only once, and each view checked once per method
+    assert calls.count("owner_as_string") == 1
+    operations = sum(
+        method != "parameters"
+        for path_item in swagger["paths"].values()
+        for method in path_item
+    )
+    assert len([call for call in calls if isinstance(call, type)]) <= operations
+
+
+def test_overrides_not_copied():
+    class DetailSerializer(serializers.Serializer):
+        detail = serializers.CharField()
+
+    not_found = openapi.Response("Not found", DetailSerializer)
+    manual_parameters = [
+        openapi.Parameter("q", openapi.IN_QUERY, type=openapi.TYPE_STRING)
+    ]
+
+    @swagger_auto_schema(
+        method="get",
+        responses={404: not_found},
+        manual_parameters=manual_parameters,
+    )
+    @api_view()
+    def test_view(request):
+        return Response({"message": "Hello, world!"})
+
+    generator = OpenAPISchemaGenerator(
+        info=openapi.Info(title="Test generator", default_version="v1"),
+        patterns=[path("test/", test_view)],
+    )
+
+    operation = generator.get_schema(None, True)["paths"]["/test/"]["get"]
+    assert operation["parameters"][0] is manual_parameters[0]
+    assert operation["responses"]["404"]["schema"]["$ref"] == "#/definitions/Detail"
+    assert not_found.schema is DetailSerializer
+
+
 def test_url_order():
     # this view with description override should show up in the schema ...
     @swagger_auto_schema(method="get", operation_description="description override")
@@ -1,3 +1,4 @@
+import gzip
 import json
 
 import pytest
@@ -8,6 +9,7 @@ except ImportError:
     coreschema = None
 
 from drf_yasg.codecs import yaml_load
+from drf_yasg.renderers import COMPRESSORS
 
 
 def _validate_text_schema_view(client, validate_schema, path, loader):
@@ -203,3 +205,130 @@ def test_extra_field_inspections(client, swagger_settings):
         ]
         == "string"
     )
+
+
+def test_conditional_request(client):
+    response = client.get("/swagger.json")
+    assert response.status_code == 200
+    etag = response["ETag"]
+    assert etag.startswith('"') and "Last-Modified" in response
+
+    not_modified = client.get("/swagger.json", HTTP_IF_NONE_MATCH=etag)
+    assert not_modified.status_code == 304
+    assert not_modified["ETag"] == etag
+    assert not not_modified.content
+
+    modified = client.get("/swagger.json", HTTP_IF_NONE_MATCH='"stale"')
+    assert modified.status_code == 200
+
+    yaml_response = client.get("/swagger.yaml")
+    assert yaml_response["ETag"] != etag
+
+
+def test_cached_view_allows_revalidation(client):
+    response = client.get("/cached/swagger.json")
+    cache_control = response["Cache-Control"]
+    assert "no-cache" in cache_control and "must-revalidate" in cache_control
+    assert "no-store" not in cache_control
+
+    ui_response = client.get("/cached/swagger/")
+    assert "no-store" in ui_response["Cache-Control"]
+
+
+def test_precompressed_spec(client, swagger_settings):
+    swagger_settings["PRECOMPRESS_SPEC"] = True
+
+    plain = client.get("/swagger.json")
+    assert "Content-Encoding" not in plain
+    assert "Accept-Encoding" in plain["Vary"]
+
+    compressed = client.get("/swagger.json", HTTP_ACCEPT_ENCODING="gzip, deflate")
+    assert compressed["Content-Encoding"] == "gzip"
+    assert "Accept-Encoding" in compressed["Vary"]
+    assert gzip.decompress(compressed.content) == plain.content
+    assert compressed["ETag"] != plain["ETag"]
+
+    not_modified = client.get(
+        "/swagger.json",
+        HTTP_ACCEPT_ENCODING="gzip",
+        HTTP_IF_NONE_MATCH=compressed["ETag"],
+    )
+    assert not_modified.status_code == 304
+
+    refused = client.get("/swagger.json", HTTP_ACCEPT_ENCODING="gzip;q=0")
+    assert "Content-Encoding" not in refused
+
+    refused_wildcard = client.get("/swagger.json", HTTP_ACCEPT_ENCODING="gzip;q=0, *")
+    assert refused_wildcard.get("Content-Encoding") != "gzip"
+
+    wildcard = client.get("/swagger.json", HTTP_ACCEPT_ENCODING="*")
+    assert wildcard["Content-Encoding"] in COMPRESSORS
+
+
+def test_filtered_schema_by_tag(client, validate_schema):
+    response = client.get("/swagger.json?tags=articles")
+    assert response.status_code == 200
+    schema = json.loads(response.content)
+    validate_schema(schema)
+    tags = {
+        tag
+        for path_item in schema["paths"].values()
+        for method, operation in path_item.items()
+        if method != "parameters"
+        for tag in operation["tags"]
+    }
+    assert tags == {"articles"}
+    assert set(schema["definitions"]) == {"Article", "ImageUpload"}
+
+
+def test_filtered_schema_by_path_prefix(client, validate_schema):
+    response = client.get(
+        "/swagger.json?path_prefix=/todo&exclude_path_prefix=/todo/harvest"
+    )
+    schema = json.loads(response.content)
+    validate_schema(schema)
+    paths = [schema["basePath"].rstrip("/") + path for path in schema["paths"]]
+    assert paths
+    assert all(path.startswith("/todo/") for path in paths)
+    assert not any(path.startswith("/todo/harvest/") for path in paths)
+    assert "Harvest" not in schema["definitions"]
+
+
+def test_filtered_schema_by_operation_id(client, validate_schema):
+    response = client.get(
+        "/swagger.json?operation_id=users_list&operation_id=users_read,articles_today"
+        "&exclude_operation_id=articles_today"
+    )
+    schema = json.loads(response.content)
+    validate_schema(schema)
+    operation_ids = {
+        operation["operationId"]
+        for path_item in schema["paths"].values()
+        for method, operation in path_item.items()
+        if method != "parameters"
+    }
+    assert operation_ids == {"users_list", "users_read"}
+
+
+def test_schema_index(client, validate_schema):
+    schema = json.loads(client.get("/swagger.json").content)
+    index = json.loads(client.get("/swagger.json?index=1").content)
+    validate_schema(index)
+    assert "definitions" not in index
+    assert index["paths"].keys() == schema["paths"].keys()
+    for path, path_item in index["paths"].items():
+        assert path_item.keys() == schema["paths"][path].keys()
+        for method, operation in path_item.items():
+            if method == "parameters":
+                continue
+            full_operation = schema["paths"][path][method]
+            assert operation["operationId"] == full_operation["operationId"]
+            assert operation["tags"] == full_operation["tags"]
+            assert "parameters" not in operation
+
+
+def test_lazy_load_spec_setting(client, swagger_settings, redoc_settings):
+    swagger_settings["LAZY_LOAD_SPEC"] = True
+    redoc_settings["LAZY_LOAD_SPEC"] = True
+    _validate_ui_schema_view(client, "/swagger/", '"lazyLoadSpec": true')
+    _validate_ui_schema_view(client, "/redoc/", '"lazyLoadSpec": true')